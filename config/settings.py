@@ -57,7 +57,10 @@ class Settings:
     LAZY_LOAD_THRESHOLD: Final[int] = 100
     
     # Hash Settings
-    HASH_ALGORITHM: Final[str] = "xxhash64"
+    HASH_ALGORITHM: Final[str] = "xxh3_64"
+    # Bump whenever HASH_ALGORITHM changes; stored hashes from another
+    # version are discarded on startup
+    HASH_CACHE_VERSION: Final[int] = 2
     
     # Backup Settings
     MAX_BACKUPS_PER_PROFILE: Final[int] = 5
@@ -2,7 +2,9 @@
 SQLite Database Manager with Hash Tracking
 """
 
+import os
 import sqlite3
+import threading
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime
@@ -14,13 +16,36 @@ from core.exceptions import DatabaseError, DatabaseConnectionError, DatabaseQuer
 from utils.logger import LoggerMixin
 
 
+# Settings rows by database file, shared by every Database instance on that
+# file so a write through one is seen by all; None/missing means re-read
+_settings_caches: Dict[str, Dict[str, str]] = {}
+_settings_lock = threading.Lock()
+
+
 class Database(LoggerMixin):
     """Manages SQLite database operations"""
     
+    # Prepared statement cache size per connection
+    CACHED_STATEMENTS = 256
+    
+    # Settings statements, kept identical so the statement cache reuses them
+    SQL_GET_SETTINGS = "SELECT key, value FROM settings"
+    SQL_SET_SETTING = """
+        INSERT OR REPLACE INTO settings (key, value, updated_at)
+        VALUES (?, ?, ?)
+    """
+    
     def __init__(self, db_path: Path = None):
         self.db_path = db_path or Settings.DATABASE_PATH
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._connection = None
+        
+        # One long-lived connection per thread, each only used by its own
+        # thread; all are tracked so close() can close every one of them
+        self._local = threading.local()
+        self._connections = set()
+        self._connections_lock = threading.Lock()
+        
+        self._settings_key = os.path.abspath(self.db_path)
 
         # Register adapters for datetime compatibility
         sqlite3.register_adapter(datetime, self._adapt_datetime)
@@ -34,16 +59,30 @@ class Database(LoggerMixin):
     def _convert_datetime(val):
         return datetime.fromisoformat(val.decode())
 
-    @contextmanager
-    def get_connection(self):
-        """Context manager for database connections"""
-        conn = None
-        try:
+    def _thread_connection(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or conn not in self._connections:
             conn = sqlite3.connect(
                 self.db_path,
-                detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES
+                detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+                cached_statements=self.CACHED_STATEMENTS,
+                check_same_thread=False  # only so close() may close it
             )
             conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with self._connections_lock:
+                self._connections.add(conn)
+            self._local.conn = conn
+        return conn
+    
+    @contextmanager
+    def get_connection(self):
+        """Context manager for a transaction on this thread's connection"""
+        conn = None
+        try:
+            conn = self._thread_connection()
             yield conn
             conn.commit()
         except sqlite3.Error as e:
@@ -51,9 +90,25 @@ class Database(LoggerMixin):
                 conn.rollback()
             self.logger.error(f"Database error: {e}")
             raise DatabaseConnectionError(f"Database connection failed: {e}")
-        finally:
+        except Exception:
             if conn:
-                conn.close()
+                conn.rollback()
+            raise
+    
+    def close(self):
+        """Close the connections of all threads (reopened on next use)"""
+        with self._connections_lock:
+            connections = list(self._connections)
+            self._connections.clear()
+        
+        for conn in connections:
+            conn.close()
+        self._local.conn = None
+    
+    def _invalidate_settings(self):
+        """Drop the cached settings of this database file"""
+        with _settings_lock:
+            _settings_caches.pop(self._settings_key, None)
     
     def initialize(self):
         """Initialize database schema"""
@@ -163,8 +218,28 @@ class Database(LoggerMixin):
             # Create indexes for performance
             self._create_indexes(cursor)
             
+            # Drop file hashes computed with a different algorithm
+            self._check_hash_version(cursor)
+            
             self.logger.info("Database schema initialized successfully")
     
+    def _check_hash_version(self, cursor):
+        """
+        Invalidate stored deployment hashes if HASH_CACHE_VERSION changed
+        
+        Rows are kept: they are the only record of what was deployed into
+        the game directory. Blank hashes never match, so affected files are
+        simply redeployed (and re-hashed) on the next deployment.
+        """
+        cursor.execute("SELECT value FROM settings WHERE key = 'hash_cache_version'")
+        row = cursor.fetchone()
+        version = str(Settings.HASH_CACHE_VERSION)
+        
+        if row is None or row['value'] != version:
+            cursor.execute("UPDATE deployment_state SET file_hash = ''")
+            cursor.execute(self.SQL_SET_SETTING, ('hash_cache_version', version, datetime.now()))
+            self._invalidate_settings()
+    
     def _create_indexes(self, cursor):
         """Create database indexes"""
         indexes = [
@@ -278,16 +353,26 @@ class Database(LoggerMixin):
             self.logger.error(f"Failed to get mod {mod_id}: {e}")
             return None
     
-    def get_all_mods(self, installed_only: bool = False) -> List[Mod]:
-        """Get all mods"""
+    def get_all_mods(
+        self,
+        installed_only: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Mod]:
+        """Get all mods, optionally one page at a time"""
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
+                sql = "SELECT * FROM mods"
                 if installed_only:
-                    cursor.execute("SELECT * FROM mods WHERE installed = 1 ORDER BY name")
+                    sql += " WHERE installed = 1"
+                sql += " ORDER BY name"
+                
+                if limit is not None:
+                    cursor.execute(sql + " LIMIT ? OFFSET ?", (limit, offset))
                 else:
-                    cursor.execute("SELECT * FROM mods ORDER BY name")
+                    cursor.execute(sql)
                 
                 mods = []
                 for row in cursor.fetchall():
@@ -441,29 +526,54 @@ class Database(LoggerMixin):
             self.logger.error(f"Failed to clear deployment state: {e}")
     
     # Settings operations
+    def get_all_settings(self) -> Dict[str, str]:
+        """Get all setting values, read once and cached until the next write"""
+        settings = _settings_caches.get(self._settings_key)
+        if settings is not None:
+            return settings
+        
+        # Filled under the lock so a concurrent write cannot be overwritten
+        # by rows read before it
+        with _settings_lock:
+            settings = _settings_caches.get(self._settings_key)
+            if settings is None:
+                try:
+                    with self.get_connection() as conn:
+                        cursor = conn.cursor()
+                        cursor.execute(self.SQL_GET_SETTINGS)
+                        settings = {row['key']: row['value'] for row in cursor.fetchall()}
+                except Exception as e:
+                    self.logger.error(f"Failed to get settings: {e}")
+                    return {}
+                _settings_caches[self._settings_key] = settings
+        
+        return settings
+    
     def get_setting(self, key: str, default: Any = None) -> Any:
         """Get setting value"""
-        try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT value FROM settings WHERE key = ?", (key,))
-                row = cursor.fetchone()
-                return row['value'] if row else default
-        except Exception as e:
-            self.logger.error(f"Failed to get setting {key}: {e}")
-            return default
+        return self.get_all_settings().get(key, default)
     
     def set_setting(self, key: str, value: Any):
         """Set setting value"""
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT OR REPLACE INTO settings (key, value, updated_at)
-                    VALUES (?, ?, ?)
-                """, (key, str(value), datetime.now()))
+                cursor.execute(self.SQL_SET_SETTING, (key, str(value), datetime.now()))
         except Exception as e:
             self.logger.error(f"Failed to set setting {key}: {e}")
+        finally:
+            self._invalidate_settings()
+    
+    def set_settings_bulk(self, items: Dict[str, Any]):
+        """Set several setting values in one transaction"""
+        try:
+            now = datetime.now()
+            with self.get_connection() as conn:
+                conn.executemany(self.SQL_SET_SETTING, [(key, str(value), now) for key, value in items.items()])
+        except Exception as e:
+            self.logger.error(f"Failed to set settings: {e}")
+        finally:
+            self._invalidate_settings()
     
     # Usage statistics
     def log_usage(self, mod_id: str, profile_name: str, action: str = "launch"):
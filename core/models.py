@@ -3,10 +3,12 @@ Core Data Models with Validation
 """
 
 from dataclasses import dataclass, field, asdict
-from typing import List, Optional, Dict, TYPE_CHECKING
+from typing import List, Optional, Dict, Set, TYPE_CHECKING
 from datetime import datetime
 from pathlib import Path
+import html
 import json
+import os
 
 if TYPE_CHECKING:
     from PyQt6.QtGui import QPixmap
@@ -102,6 +104,42 @@ class Mod:
         parts = mod_id.split('-', 1)
         return len(parts) == 2 and all(p.strip() for p in parts)
     
+    @property
+    def list_text(self) -> str:
+        """Display text for mod lists, rebuilt only when the shown fields change"""
+        key = (self.name, self.version, self.author, self.update_available)
+        cached = self.__dict__.get('_list_text_cache')
+        
+        if cached is None or cached[0] != key:
+            text = f"{self.name}\n"
+            text += f"   v{self.version} by {self.author}"
+            
+            if self.update_available:
+                text += "\n   Update available"
+            
+            cached = (key, text)
+            self._list_text_cache = cached
+        
+        return cached[1]
+    
+    @property
+    def _escaped(self) -> Dict[str, str]:
+        """HTML-escaped copies of the text fields shown in rich-text views"""
+        key = (
+            self.id, self.name, self.author, self.version,
+            self.description, self.full_description
+        )
+        cached = self.__dict__.get('_escaped_cache')
+        
+        if cached is None or cached[0] != key:
+            cached = (key, dict(zip(
+                ('id', 'name', 'author', 'version', 'description', 'full_description'),
+                map(html.escape, key)
+            )))
+            self._escaped_cache = cached
+        
+        return cached[1]
+    
     def get_icon_pixmap(self, size: int = Settings.ICON_SIZE_MEDIUM) -> 'QPixmap':
         """Get mod icon as QPixmap"""
         from PyQt6.QtGui import QPixmap
@@ -207,6 +245,9 @@ class Profile:
     game_path: Optional[Path] = None
     active: bool = False
     
+    # Signature of the mod list as left by the last dependency sort
+    _sort_sig: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Validate profile data"""
         if not self.name or len(self.name) < Settings.MIN_PROFILE_NAME_LENGTH:
@@ -228,11 +269,19 @@ class Profile:
         """Add mod to profile"""
         if not any(m.id == mod.id for m in self.mods):
             self.mods.append(mod)
+            self._sort_sig = None
             self.last_modified = datetime.now()
     
     def remove_mod(self, mod_id: str):
         """Remove mod from profile"""
         self.mods = [m for m in self.mods if m.id != mod_id]
+        self._sort_sig = None
+        self.last_modified = datetime.now()
+    
+    def remove_mods(self, mod_ids: Set[str]):
+        """Remove several mods from profile in one pass"""
+        self.mods = [m for m in self.mods if m.id not in mod_ids]
+        self._sort_sig = None
         self.last_modified = datetime.now()
     
     def get_mod(self, mod_id: str) -> Optional[Mod]:
@@ -260,13 +309,25 @@ class Profile:
         if mod:
             self.mods.remove(mod)
             self.mods.insert(new_position, mod)
+            self._sort_sig = None
             # Update load order values
             for i, m in enumerate(self.mods):
                 m.load_order = i
             self.last_modified = datetime.now()
     
+    def _mods_signature(self) -> int:
+        """Cheap signature of mod order and dependency edges"""
+        return hash(tuple(
+            (m.id, tuple(d.mod_id for d in m.dependencies))
+            for m in self.mods
+        ))
+    
     def sort_by_dependencies(self):
         """Sort mods by dependency order (topological sort)"""
+        # Skip the resolver if the list is unchanged since the last sort
+        if self._sort_sig is not None and self._sort_sig == self._mods_signature():
+            return
+        
         from services.dependency_resolver import DependencyResolver
         resolver = DependencyResolver()
         sorted_ids = resolver.resolve_load_order(self.mods)
@@ -281,12 +342,18 @@ class Profile:
         self.mods = sorted_mods
         for i, mod in enumerate(self.mods):
             mod.load_order = i
+        
+        self._sort_sig = self._mods_signature()
     
     def export_to_json(self, path: Path):
         """Export profile to JSON file"""
         data = self.to_dict()
-        with open(path, 'w', encoding='utf-8') as f:
+        
+        # Write to a temp file and swap it in so readers never see a partial file
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
     
     @classmethod
     def import_from_json(cls, path: Path) -> 'Profile':
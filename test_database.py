@@ -6,6 +6,7 @@ import pytest
 from pathlib import Path
 from datetime import datetime
 import tempfile
+import threading
 
 from core.database import Database
 from core.models import Mod, ModDependency
@@ -23,6 +24,7 @@ def temp_db():
     yield db
     
     # Cleanup
+    db.close()
     if db_path.exists():
         db_path.unlink()
 
@@ -118,6 +120,23 @@ class TestDatabase:
         installed = temp_db.get_all_mods(installed_only=True)
         assert len(installed) == 2
     
+    def test_get_all_mods_paginated(self, temp_db, sample_mod):
+        """Test getting mods one page at a time"""
+        temp_db.save_mod(sample_mod)
+        temp_db.save_mod(Mod(
+            id="Author2-Mod2",
+            name="Second Mod",
+            author="Author2",
+            version="2.0.0",
+            installed=True
+        ))
+        
+        first = temp_db.get_all_mods(installed_only=True, limit=1)
+        second = temp_db.get_all_mods(installed_only=True, limit=1, offset=1)
+        
+        assert [m.name for m in first] == ["Second Mod"]
+        assert [m.name for m in second] == ["Test Mod"]
+    
     def test_delete_mod(self, temp_db, sample_mod):
         """Test deleting mod"""
         temp_db.save_mod(sample_mod)
@@ -181,6 +200,21 @@ class TestDatabase:
         state = temp_db.get_deployment_state("TestProfile")
         assert len(state) == 0
     
+    def test_hash_version_change_keeps_deployment_state(self, temp_db):
+        """Test a hash algorithm change blanks hashes but keeps deployed files"""
+        temp_db.save_deployment_state(
+            "/path/to/file.dll",
+            "abc123hash",
+            "TestMod",
+            "TestProfile"
+        )
+        temp_db.set_setting("hash_cache_version", "0")
+        
+        temp_db.initialize()
+        
+        state = temp_db.get_deployment_state("TestProfile")
+        assert state == {"/path/to/file.dll": ""}
+    
     def test_settings(self, temp_db):
         """Test settings operations"""
         # Set setting
@@ -194,6 +228,38 @@ class TestDatabase:
         value = temp_db.get_setting("nonexistent", "default")
         assert value == "default"
     
+    def test_settings_bulk(self, temp_db):
+        """Test writing several settings at once"""
+        temp_db.set_settings_bulk({"theme": "Light", "max_retries": 5})
+        
+        assert temp_db.get_setting("theme") == "Light"
+        assert temp_db.get_setting("max_retries") == "5"
+    
+    def test_settings_shared_between_instances(self, temp_db):
+        """Test a write through one instance is seen by another on the same file"""
+        other = Database(temp_db.db_path)
+        try:
+            assert other.get_setting("theme") is None
+            
+            temp_db.set_setting("theme", "Light")
+            
+            assert other.get_setting("theme") == "Light"
+        finally:
+            other.close()
+    
+    def test_close_closes_all_threads(self, temp_db):
+        """Test close() also closes connections opened by other threads"""
+        opened = len(temp_db._connections)
+        worker = threading.Thread(target=temp_db.get_all_mods)
+        worker.start()
+        worker.join()
+        assert len(temp_db._connections) == opened + 1
+        
+        temp_db.close()
+        
+        assert not temp_db._connections
+        assert temp_db.get_all_mods() == []
+    
     def test_usage_stats(self, temp_db, sample_mod):
         """Test usage statistics"""
         temp_db.save_mod(sample_mod)
@@ -0,0 +1,214 @@
+"""
+Unit tests for file_utils module
+"""
+
+import asyncio
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from core.exceptions import ExtractionError
+from utils import file_utils
+from utils.file_utils import (
+    ArchiveExtractor,
+    FileOperations,
+    find_files_by_extension,
+    safe_remove_directory
+)
+
+
+def _tree(root: Path) -> dict:
+    """Map every file under root (relative posix path) to its contents"""
+    return {
+        path.relative_to(root).as_posix(): path.read_bytes()
+        for path in root.rglob('*') if path.is_file()
+    }
+
+
+@pytest.fixture
+def temp_dir():
+    """Create temporary directory for testing"""
+    with tempfile.TemporaryDirectory() as d:
+        yield Path(d)
+
+
+@pytest.fixture
+def sample_zip(temp_dir):
+    """Create a mod-like archive with nested folders and a directory entry"""
+    archive = temp_dir / "mod.zip"
+    with zipfile.ZipFile(archive, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("manifest.json", '{"name": "TestMod"}')
+        zf.writestr("README.md", "# Test Mod\n" * 100)
+        zf.writestr("plugins/", "")
+        zf.writestr("plugins/TestMod.dll", os.urandom(64 * 1024))
+        zf.writestr("plugins/lang/en.json", '{"hello": "Hello"}')
+        for i in range(20):
+            zf.writestr(f"config/part{i}.cfg", f"value = {i}\n" * (i + 1))
+    return archive
+
+
+class TestExtractZipAsync:
+    """Test ArchiveExtractor.extract_zip_async"""
+
+    def test_same_tree_as_extract_zip(self, temp_dir, sample_zip):
+        """Test async extraction produces the same files as extract_zip"""
+        sync_dir = temp_dir / "sync"
+        async_dir = temp_dir / "async"
+
+        sync_files = ArchiveExtractor.extract_zip(sample_zip, sync_dir)
+        async_files = asyncio.run(
+            ArchiveExtractor.extract_zip_async(sample_zip, async_dir, max_workers=4)
+        )
+
+        assert _tree(async_dir) == _tree(sync_dir)
+        assert [p.relative_to(async_dir) for p in async_files] == \
+            [p.relative_to(sync_dir) for p in sync_files]
+
+    def test_reports_progress(self, temp_dir, sample_zip):
+        """Test progress is reported per entry and ends at total"""
+        calls = []
+
+        asyncio.run(ArchiveExtractor.extract_zip_async(
+            sample_zip,
+            temp_dir / "out",
+            progress_callback=lambda current, total, name: calls.append((current, total, name))
+        ))
+
+        with zipfile.ZipFile(sample_zip) as zf:
+            names = zf.namelist()
+        total = len(names)
+
+        assert [current for current, _, _ in calls] == list(range(1, total + 1))
+        assert all(t == total for _, t, _ in calls)
+        assert sorted(name for _, _, name in calls) == sorted(names)
+
+    def test_rejects_path_traversal(self, temp_dir):
+        """Test archives escaping the target directory are refused"""
+        archive = temp_dir / "evil.zip"
+        with zipfile.ZipFile(archive, 'w') as zf:
+            zf.writestr("../evil.txt", "x")
+
+        with pytest.raises(ExtractionError):
+            asyncio.run(ArchiveExtractor.extract_zip_async(archive, temp_dir / "out"))
+
+        assert not (temp_dir / "evil.txt").exists()
+
+    @pytest.mark.parametrize("member", [
+        "/abs/evil.txt",
+        "\\abs\\evil.txt",
+        "C:/abs/evil.txt",
+        "C:evil.txt",
+    ])
+    def test_rejects_absolute_members(self, temp_dir, member):
+        """Test anchored and drive-letter members are refused before any mkdir"""
+        archive = temp_dir / "evil.zip"
+        with zipfile.ZipFile(archive, 'w') as zf:
+            zf.writestr("ok.txt", "x")
+            zf.writestr(member, "x")
+
+        with pytest.raises(ExtractionError):
+            asyncio.run(ArchiveExtractor.extract_zip_async(archive, temp_dir / "out"))
+
+        assert not (temp_dir / "out" / "abs").exists()
+        assert not Path("/abs").exists()
+
+    def test_corrupt_archive(self, temp_dir):
+        """Test a non-zip file raises ExtractionError"""
+        archive = temp_dir / "broken.zip"
+        archive.write_bytes(b"not a zip file")
+
+        with pytest.raises(ExtractionError):
+            asyncio.run(ArchiveExtractor.extract_zip_async(archive, temp_dir / "out"))
+
+
+class TestGetDirectorySize:
+    """Test FileOperations.get_directory_size"""
+
+    def test_matches_rglob(self, temp_dir, sample_zip):
+        """Test the total equals the sum of file sizes found by rglob"""
+        ArchiveExtractor.extract_zip(sample_zip, temp_dir / "mod")
+        root = temp_dir / "mod"
+
+        expected = sum(p.stat().st_size for p in root.rglob('*') if p.is_file())
+
+        assert FileOperations.get_directory_size(root) == expected
+
+    def test_missing_directory(self, temp_dir):
+        """Test a missing path counts as empty instead of raising"""
+        assert FileOperations.get_directory_size(temp_dir / "missing") == 0
+
+    def test_file_path(self, temp_dir, sample_zip):
+        """Test a file path (not a directory) counts as empty"""
+        assert FileOperations.get_directory_size(sample_zip) == 0
+
+
+class TestFindFilesByExtension:
+    """Test find_files_by_extension"""
+
+    def test_matches_rglob(self, temp_dir, sample_zip):
+        """Test the same files are found as with one rglob per extension"""
+        root = temp_dir / "mod"
+        ArchiveExtractor.extract_zip(sample_zip, root)
+        (root / "plugins" / "Upper.JSON").write_text("{}")
+
+        found = find_files_by_extension(root, ["json", ".dll"])
+        expected = [p for ext in (".json", ".dll") for p in root.rglob(f"*{ext}")]
+
+        assert sorted(found) == sorted(expected)
+        assert root / "plugins" / "Upper.JSON" not in found
+
+    def test_missing_directory(self, temp_dir):
+        """Test a missing directory yields no files instead of raising"""
+        assert find_files_by_extension(temp_dir / "missing", [".dll"]) == []
+
+
+class TestSafeRemoveDirectory:
+    """Test safe_remove_directory"""
+
+    def test_removes_read_only_files(self, temp_dir):
+        """Test read-only files do not block removal"""
+        target = temp_dir / "mod"
+        target.mkdir()
+        locked = target / "plugin.dll"
+        locked.write_bytes(b"x")
+        locked.chmod(0o444)
+
+        assert safe_remove_directory(target)
+        assert not target.exists()
+
+    def test_locked_directory_is_moved_to_tombstone(self, temp_dir, monkeypatch):
+        """Test a directory that stays locked is renamed out of the way"""
+        target = temp_dir / "mod"
+        target.mkdir()
+        (target / "plugin.dll").write_bytes(b"x")
+
+        real_rmtree = file_utils.shutil.rmtree
+
+        def locked_rmtree(path, *args, **kwargs):
+            if Path(path) == target:
+                raise PermissionError("in use")
+            return real_rmtree(path, *args, **kwargs)
+
+        monkeypatch.setattr(file_utils.shutil, "rmtree", locked_rmtree)
+        monkeypatch.setattr(file_utils.time, "sleep", lambda _: None)
+
+        assert safe_remove_directory(target)
+        assert not target.exists()
+        assert list(temp_dir.iterdir()) == []
+
+    def test_purges_leftover_tombstones(self, temp_dir):
+        """Test tombstones left by earlier removals are cleaned up"""
+        target = temp_dir / "mod"
+        target.mkdir()
+        leftover = temp_dir / ".mod.deleted-1-2"
+        leftover.mkdir()
+        (leftover / "plugin.dll").write_bytes(b"x")
+        unrelated = temp_dir / ".other.deleted-1-2"
+        unrelated.mkdir()
+
+        assert safe_remove_directory(target)
+        assert not leftover.exists()
+        assert unrelated.exists()
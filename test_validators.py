@@ -0,0 +1,291 @@
+"""
+Unit tests for validators module
+"""
+
+import pytest
+
+from utils.validators import (
+    Validator,
+    compile_validator,
+    validate_mod_id,
+    validate_mod_ids,
+    validate_version,
+    validate_port,
+    validate_ports,
+    validate_in_range,
+    validate_in_range_array,
+    validate_positive_integer,
+    validate_positive_integer_array,
+    validate_game_path,
+    clear_path_cache
+)
+from utils import validators
+
+
+MOD_IDS = [
+    "Author-ModName",
+    "denikson-BepInExPack_Valheim",
+    "",
+    "NoSeparator",
+    "Too-Many-Parts",
+    "-MissingAuthor",
+    "MissingName-",
+    "Author-ModName\n",
+    "Äuthor-ModName",
+    "A" * 50 + "-" + "B" * 49,
+    "A" * 50 + "-" + "B" * 50,
+    None,
+    123,
+]
+
+PORTS = [1, 80, 2456, 65535, 0, -1, 65536, True, False, 80.0, "80", None]
+
+
+class TestBatchValidators:
+    """Test batch validators against their single-value counterparts"""
+
+    def test_validate_mod_ids_matches_single(self):
+        """Test validate_mod_ids agrees with validate_mod_id per element"""
+        assert validate_mod_ids(MOD_IDS) == [validate_mod_id(i) for i in MOD_IDS]
+
+    def test_validate_mod_ids_rejects_trailing_newline(self):
+        """Test a trailing newline is not accepted by either validator"""
+        valid, error = validate_mod_ids(["Author-ModName\n"])[0]
+        assert valid is False
+        assert error == validate_mod_id("Author-ModName\n")[1]
+
+    def test_validate_ports_matches_single(self):
+        """Test validate_ports agrees with validate_port per element"""
+        assert validate_ports(PORTS) == [validate_port(p)[0] for p in PORTS]
+
+    def test_validate_ports_rejects_bool(self):
+        """Test booleans are not accepted as ports"""
+        assert validate_ports([True, False]) == [False, False]
+        assert validate_port(True)[0] is False
+
+    @pytest.mark.parametrize("size", [10, 1000])
+    def test_validate_ports_array_matches_single(self, size):
+        """Test integer arrays (below and above the kernel threshold) agree per element"""
+        np = pytest.importorskip("numpy")
+        values = np.linspace(-10, 70000, size).astype(np.int64)
+
+        mask = validate_ports(values)
+
+        assert mask.dtype == np.bool_
+        assert mask.tolist() == [validate_port(int(v))[0] for v in values]
+
+
+class TestArrayValidators:
+    """Test numpy-backed array validators against their scalar counterparts"""
+
+    @pytest.mark.parametrize("bounds", [(None, None), (0, None), (None, 10), (-2.5, 7.5)])
+    def test_validate_in_range_array_matches_scalar(self, bounds):
+        """Test float arrays agree with validate_in_range per element"""
+        np = pytest.importorskip("numpy")
+        values = np.array([-5.0, -2.5, 0.0, 3.3, 7.5, 7.6, 10.0, 11.0])
+        min_value, max_value = bounds
+
+        mask = validate_in_range_array(values, min_value, max_value)
+
+        assert mask.dtype == np.bool_
+        assert mask.tolist() == [
+            validate_in_range(float(v), min_value, max_value)[0] for v in values
+        ]
+
+    def test_validate_in_range_array_non_numeric(self):
+        """Test non-numeric arrays are rejected like non-numeric scalars"""
+        np = pytest.importorskip("numpy")
+        values = np.array(["1", "2"])
+
+        assert validate_in_range_array(values, 0, 5).tolist() == [False, False]
+        assert validate_in_range("1", 0, 5)[0] is False
+
+    def test_validate_in_range_list_fallback(self):
+        """Test plain lists fall back to validate_in_range per item"""
+        values = [-1, 0, 2.5, 5, 6, "3", None, True, float("nan")]
+        assert validate_in_range_array(values, 0, 5) == [
+            validate_in_range(v, 0, 5)[0] for v in values
+        ]
+
+    @pytest.mark.parametrize("bounds", [(None, None), (0, 5)])
+    def test_validate_in_range_rejects_bool_and_nan(self, bounds):
+        """Test bools and NaN are rejected by both the scalar and array paths"""
+        np = pytest.importorskip("numpy")
+        min_value, max_value = bounds
+
+        assert validate_in_range(True, min_value, max_value)[0] is False
+        assert validate_in_range(float("nan"), min_value, max_value)[0] is False
+        assert validate_in_range_array(
+            np.array([True, False]), min_value, max_value
+        ).tolist() == [False, False]
+        assert validate_in_range_array(
+            np.array([1.0, np.nan]), min_value, max_value
+        ).tolist() == [True, False]
+        assert validate_in_range_array(
+            [True, float("nan"), 1.0], min_value, max_value
+        ) == [False, False, True]
+
+    @pytest.mark.parametrize("min_value", [0, 1, 5])
+    def test_validate_positive_integer_array_matches_scalar(self, min_value):
+        """Test integer arrays agree with validate_positive_integer per element"""
+        np = pytest.importorskip("numpy")
+        values = np.arange(-3, 8)
+
+        mask = validate_positive_integer_array(values, min_value)
+
+        assert mask.tolist() == [
+            validate_positive_integer(int(v), min_value)[0] for v in values
+        ]
+
+    def test_validate_positive_integer_array_rejects_non_int(self):
+        """Test float and bool arrays are rejected like float and bool scalars"""
+        np = pytest.importorskip("numpy")
+
+        assert validate_positive_integer_array(np.array([1.0, 2.0])).tolist() == [False, False]
+        assert validate_positive_integer_array(np.array([np.nan])).tolist() == [False]
+        assert validate_positive_integer_array(np.array([True, True])).tolist() == [False, False]
+        assert validate_positive_integer(2.0)[0] is False
+        assert validate_positive_integer(True)[0] is False
+
+    def test_validate_positive_integer_list_fallback(self):
+        """Test plain lists fall back to validate_positive_integer per item"""
+        values = [-1, 0, 1, 2, True, False, 2.0, float("nan"), "3"]
+        assert validate_positive_integer_array(values) == [
+            validate_positive_integer(v)[0] for v in values
+        ]
+
+
+SCHEMAS = [
+    {},
+    {"required": True},
+    {"min_length": 3},
+    {"max_length": 5},
+    {"pattern": r"[a-z]+"},
+    {"required": True, "min_length": 3, "max_length": 5, "pattern": r"[a-z]+\Z"},
+]
+
+VALUES = ["", None, "ab", "abc", "abcde", "abcdef", "ABC", "abc1", 0, 12345, []]
+
+
+def _interpreted(value, schema, collect_all):
+    """Run the equivalent Validator chain for a schema"""
+    validator = Validator(value, collect_all=collect_all)
+    if schema.get("required"):
+        validator.required()
+    if "min_length" in schema:
+        validator.min_length(schema["min_length"])
+    if "max_length" in schema:
+        validator.max_length(schema["max_length"])
+    if "pattern" in schema:
+        validator.matches(schema["pattern"])
+    return validator
+
+
+class TestCompileValidator:
+    """Test compiled validators against the interpreted Validator chain"""
+
+    @pytest.mark.parametrize("collect_all", [False, True])
+    @pytest.mark.parametrize("schema", SCHEMAS)
+    def test_matches_validator_chain(self, schema, collect_all):
+        """Test same accept/reject result and messages for every value"""
+        check = compile_validator(collect_all=collect_all, **schema)
+
+        for value in VALUES:
+            expected = _interpreted(value, schema, collect_all)
+            errors = check(value)
+            assert errors == expected.get_errors(), value
+            assert (not errors) == expected.is_valid(), value
+
+    def test_none_is_treated_as_empty_string(self):
+        """Test None is measured and matched as '' rather than 'None'"""
+        check = compile_validator(min_length=1, collect_all=True)
+        assert check(None) == ["Minimum length is 1"]
+        assert check(None) == Validator(None).min_length(1).get_errors()
+
+        check = compile_validator(max_length=3, pattern=r"\Z")
+        assert check(None) == []
+        assert Validator(None).max_length(3).matches(r"\Z").is_valid()
+
+    def test_short_circuit_stops_at_first_error(self):
+        """Test only the first failing check is reported by default"""
+        check = compile_validator(required=True, min_length=3, pattern=r"[a-z]+")
+        assert check("") == ["Value is required"]
+
+        check = compile_validator(required=True, min_length=3, pattern=r"[a-z]+", collect_all=True)
+        assert check("") == [
+            "Value is required",
+            "Minimum length is 3",
+            "Value does not match required pattern",
+        ]
+
+    def test_returns_fresh_list(self):
+        """Test callers can mutate the returned error list safely"""
+        check = compile_validator(required=True)
+        check("").append("extra")
+        assert check("") == ["Value is required"]
+
+
+class TestCachedValidators:
+    """Test the memoised string validators with non-string input"""
+
+    @pytest.mark.parametrize("value", [None, 123, ["Author-ModName"], {"a": 1}])
+    def test_validate_mod_id_unhashable(self, value):
+        """Test non-string input gets an error result instead of TypeError"""
+        valid, error = validate_mod_id(value)
+        assert valid is False
+        assert error
+
+    def test_validate_mod_ids_unhashable(self):
+        """Test validate_mod_ids handles unhashable items like validate_mod_id"""
+        values = ["Author-ModName", ["Author-ModName"], {}]
+        assert validate_mod_ids(values) == [validate_mod_id(v) for v in values]
+
+
+class TestGamePath:
+    """Test validate_game_path error handling"""
+
+    def setup_method(self):
+        clear_path_cache()
+
+    def test_embedded_nul(self):
+        """Test a path with an embedded NUL is rejected, not raised"""
+        assert validate_game_path("/tmp/game\x00dir") == (False, "Invalid path format")
+
+    def test_message_uses_path_as_given(self, tmp_path, monkeypatch):
+        """Test a cached result never reports another spelling of the path"""
+        monkeypatch.chdir(tmp_path.parent)
+        relative = tmp_path.name
+
+        absolute_error = validate_game_path(str(tmp_path))[1]
+        relative_error = validate_game_path(relative)[1]
+
+        assert str(tmp_path) in absolute_error
+        assert relative_error.endswith(f": {relative}")
+
+    def test_cache_is_bounded(self, tmp_path):
+        """Test the result cache never grows past its size limit"""
+        for i in range(validators._PATH_CACHE_SIZE * 2):
+            validate_game_path(tmp_path / str(i))
+
+        assert len(validators._path_cache) == validators._PATH_CACHE_SIZE
+
+
+VERSIONS = ["1.2.3", "0.0.0", "10.20.30", "1.2", "1.2.3.4", "1..3", "a.b.c",
+            "1.2.3\n", " 1.2.3", "1.2.-3", "١.٢.٣", ""]
+
+
+class TestStringValidators:
+    """Test hand-written scans against their reference regexes"""
+
+    def test_validate_mod_id_matches_regex(self):
+        """Test validate_mod_id accepts exactly what _MOD_ID_RE fullmatches"""
+        for mod_id in MOD_IDS:
+            if isinstance(mod_id, str) and len(mod_id) <= 100:
+                expected = validators._MOD_ID_RE.fullmatch(mod_id) is not None
+                assert validate_mod_id(mod_id)[0] is expected, mod_id
+
+    def test_validate_version_matches_regex(self):
+        """Test validate_version accepts exactly what _VERSION_RE fullmatches"""
+        for version in VERSIONS:
+            expected = validators._VERSION_RE.fullmatch(version) is not None
+            assert validate_version(version)[0] is expected, version
@@ -519,6 +519,7 @@ class MainWindow(QMainWindow, LoggerMixin):
         
         if reply == QMessageBox.StandardButton.Yes:
             self.logger.info("Application closing")
+            self.repository_tab.shutdown()
             event.accept()
         else:
             event.ignore()
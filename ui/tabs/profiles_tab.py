@@ -6,12 +6,14 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
     QListWidget, QListWidgetItem, QPushButton, QLabel,
     QCheckBox, QMessageBox, QInputDialog, QFileDialog,
-    QMenu, QDialog
+    QMenu, QDialog, QLineEdit, QTextEdit, QFormLayout,
+    QStyle
 )
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QAction
 from pathlib import Path
 from datetime import datetime
+from functools import cached_property
 
 from core.database import Database
 from core.models import Profile, Mod
@@ -26,44 +28,30 @@ class ProfileEditorDialog(QDialog):
     
     def __init__(self, profile: Profile = None, parent=None):
         super().__init__(parent)
-        self.profile = profile
-        self.is_new = profile is None
+        self.profile = None
+        self.is_new = True
         
         self.setup_ui()
-        
-        if not self.is_new:
-            self.load_profile_data()
+        self.reset(profile)
     
     def setup_ui(self):
         """Setup dialog UI"""
-        self.setWindowTitle("New Profile" if self.is_new else "Edit Profile")
         self.setMinimumWidth(500)
         
-        layout = QVBoxLayout(self)
+        layout = QFormLayout(self)
         
         # Name input
-        name_label = QLabel("Profile Name:")
-        layout.addWidget(name_label)
-        
-        from PyQt6.QtWidgets import QLineEdit
         self.name_input = QLineEdit()
         self.name_input.setPlaceholderText("Enter profile name...")
-        layout.addWidget(self.name_input)
+        layout.addRow("Profile Name:", self.name_input)
         
         # Description input
-        desc_label = QLabel("Description (optional):")
-        layout.addWidget(desc_label)
-        
-        from PyQt6.QtWidgets import QTextEdit
         self.desc_input = QTextEdit()
         self.desc_input.setPlaceholderText("Enter profile description...")
         self.desc_input.setMaximumHeight(100)
-        layout.addWidget(self.desc_input)
+        layout.addRow("Description (optional):", self.desc_input)
         
         # Game path input
-        game_path_label = QLabel("Game Path (optional):")
-        layout.addWidget(game_path_label)
-        
         game_path_widget = QWidget()
         game_path_layout = QHBoxLayout(game_path_widget)
         game_path_layout.setContentsMargins(0, 0, 0, 0)
@@ -76,7 +64,7 @@ class ProfileEditorDialog(QDialog):
         browse_btn.clicked.connect(self.browse_game_path)
         game_path_layout.addWidget(browse_btn)
         
-        layout.addWidget(game_path_widget)
+        layout.addRow("Game Path (optional):", game_path_widget)
         
         # Buttons
         buttons_widget = QWidget()
@@ -92,7 +80,20 @@ class ProfileEditorDialog(QDialog):
         save_btn.setDefault(True)
         buttons_layout.addWidget(save_btn)
         
-        layout.addWidget(buttons_widget)
+        layout.addRow(buttons_widget)
+    
+    def reset(self, profile: Profile = None):
+        """Prepare the dialog for creating a new profile or editing an existing one"""
+        self.profile = profile
+        self.is_new = profile is None
+        
+        self.setWindowTitle("New Profile" if self.is_new else "Edit Profile")
+        self.name_input.clear()
+        self.desc_input.clear()
+        self.game_path_input.clear()
+        
+        if not self.is_new:
+            self.load_profile_data()
     
     def load_profile_data(self):
         """Load existing profile data"""
@@ -131,19 +132,31 @@ class ProfilesTab(QWidget, LoggerMixin):
     profile_deleted = pyqtSignal(str)  # profile_name
     profile_activated = pyqtSignal(str)  # profile_name
     
+    # Row icons shared by all instances, created on first display
+    _ICON_ENABLED = None
+    _ICON_DISABLED = None
+    
     def __init__(self, database: Database, deployment_engine: DeploymentEngine):
         super().__init__()
         self.db = database
         self.deployment_engine = deployment_engine
-        self.dependency_resolver = DependencyResolver()
         
         self.profiles = []
         self.current_profile = None
-        self.available_mods = []
+        self._available_mods = None
+        self._last_mods_sig = None
         
         self.setup_ui()
+        
+        # Editor dialog is reused for every create/edit
+        self._editor = ProfileEditorDialog(parent=self)
+        
         self.load_profiles()
-        self.load_available_mods()
+    
+    @cached_property
+    def dependency_resolver(self) -> DependencyResolver:
+        """Dependency resolver, created on first use"""
+        return DependencyResolver()
     
     def setup_ui(self):
         """Setup user interface"""
@@ -192,6 +205,7 @@ class ProfilesTab(QWidget, LoggerMixin):
         
         # List widget
         self.profile_list = QListWidget()
+        self.profile_list.setUniformItemSizes(True)
         self.profile_list.currentItemChanged.connect(self.on_profile_selected)
         layout.addWidget(self.profile_list)
         
@@ -292,12 +306,16 @@ class ProfilesTab(QWidget, LoggerMixin):
         """Load profiles from storage"""
         try:
             self.profiles.clear()
-            self.profile_list.clear()
+            items = []
             
             profiles_dir = Settings.PROFILES_DIR
             profiles_dir.mkdir(parents=True, exist_ok=True)
             
-            for profile_file in profiles_dir.glob("*.json"):
+            for profile_file in profiles_dir.iterdir():
+                # Skip dotfiles and partially written temp files
+                if profile_file.suffix != '.json' or profile_file.name.startswith('.'):
+                    continue
+                
                 try:
                     profile = Profile.import_from_json(profile_file)
                     self.profiles.append(profile)
@@ -314,19 +332,36 @@ class ProfilesTab(QWidget, LoggerMixin):
                     item.setText(text)
                     item.setData(Qt.ItemDataRole.UserRole, profile)
                     
-                    self.profile_list.addItem(item)
+                    items.append(item)
                     
                 except Exception as e:
-                    self.logger.error(f"Failed to load profile {profile_file}: {e}")
+                    self.logger.error("Failed to load profile %s: %s", profile_file, e)
+            
+            # Repopulate with repaints suspended so the list lays out once
+            self.profile_list.setUpdatesEnabled(False)
+            try:
+                self.profile_list.clear()
+                for item in items:
+                    self.profile_list.addItem(item)
+            finally:
+                self.profile_list.setUpdatesEnabled(True)
+                self.profile_list.viewport().update()
             
             self.count_label.setText(f"Profiles: {len(self.profiles)}")
             
         except Exception as e:
-            self.logger.error(f"Failed to load profiles: {e}")
+            self.logger.error("Failed to load profiles: %s", e)
+    
+    @property
+    def available_mods(self) -> list:
+        """Installed mods, fetched from the database on first access"""
+        if self._available_mods is None:
+            self.load_available_mods()
+        return self._available_mods
     
     def load_available_mods(self):
         """Load available mods from repository"""
-        self.available_mods = self.db.get_all_mods(installed_only=True)
+        self._available_mods = self.db.get_all_mods(installed_only=True)
     
     def on_profile_selected(self, current, previous):
         """Handle profile selection"""
@@ -339,26 +374,49 @@ class ProfilesTab(QWidget, LoggerMixin):
         # Update display
         self.update_mods_display()
     
+    def _load_mod_icons(self):
+        """Build the shared mod row icons once"""
+        if ProfilesTab._ICON_ENABLED is not None:
+            return
+        
+        style = self.style()
+        ProfilesTab._ICON_ENABLED = style.standardIcon(QStyle.StandardPixmap.SP_DialogApplyButton)
+        ProfilesTab._ICON_DISABLED = style.standardIcon(QStyle.StandardPixmap.SP_DialogCancelButton)
+    
     def update_mods_display(self):
         """Update mods display for current profile"""
         if not self.current_profile:
             return
         
+        # Skip the rebuild if nothing visible (including row order) has changed
+        sig = (
+            self.current_profile.name,
+            tuple(
+                (m.id, m.name, m.version, m.enabled, m.update_available)
+                for m in self.current_profile.mods
+            )
+        )
+        if sig == self._last_mods_sig:
+            return
+        self._last_mods_sig = sig
+        
         self.profile_title.setText(f"<h3>{self.current_profile.name}</h3>")
         
         self.mods_list.clear()
         
+        self._load_mod_icons()
+        
         for mod in self.current_profile.mods:
             item = QListWidgetItem()
             
-            # Checkbox-like display
-            enabled_icon = "☑️" if mod.enabled else "☐"
-            text = f"{enabled_icon} 🎨 {mod.name} v{mod.version}"
+            # Enabled state is shown by the row icon
+            item.setIcon(self._ICON_ENABLED if mod.enabled else self._ICON_DISABLED)
+            item.setText(f"{mod.name} v{mod.version}")
             
             if mod.update_available:
-                text += " ⬆️"
+                item.setData(Qt.ItemDataRole.ToolTipRole, "Update available")
+                item.setForeground(self.palette().link())
             
-            item.setText(text)
             item.setData(Qt.ItemDataRole.UserRole, mod)
             
             self.mods_list.addItem(item)
@@ -367,7 +425,8 @@ class ProfilesTab(QWidget, LoggerMixin):
     
     def create_profile(self):
         """Create new profile"""
-        dialog = ProfileEditorDialog(parent=self)
+        dialog = self._editor
+        dialog.reset()
         
         if dialog.exec() == QDialog.DialogCode.Accepted:
             data = dialog.get_profile_data()
@@ -397,7 +456,7 @@ class ProfilesTab(QWidget, LoggerMixin):
                 profile_file = Settings.PROFILES_DIR / f"{profile.name}.json"
                 profile.export_to_json(profile_file)
                 
-                self.logger.info(f"Created profile: {profile.name}")
+                self.logger.info("Created profile: %s", profile.name)
                 
                 # Reload profiles
                 self.load_profiles()
@@ -412,7 +471,7 @@ class ProfilesTab(QWidget, LoggerMixin):
                 )
                 
             except Exception as e:
-                self.logger.error(f"Failed to create profile: {e}")
+                self.logger.error("Failed to create profile: %s", e)
                 QMessageBox.critical(
                     self,
                     "Error",
@@ -449,7 +508,7 @@ class ProfilesTab(QWidget, LoggerMixin):
                 )
                 
             except Exception as e:
-                self.logger.error(f"Failed to clone profile: {e}")
+                self.logger.error("Failed to clone profile: %s", e)
                 QMessageBox.critical(self, "Error", f"Failed to clone:\n{str(e)}")
     
     def edit_profile(self):
@@ -457,7 +516,8 @@ class ProfilesTab(QWidget, LoggerMixin):
         if not self.current_profile:
             return
         
-        dialog = ProfileEditorDialog(self.current_profile, parent=self)
+        dialog = self._editor
+        dialog.reset(self.current_profile)
         
         if dialog.exec() == QDialog.DialogCode.Accepted:
             data = dialog.get_profile_data()
@@ -485,7 +545,7 @@ class ProfilesTab(QWidget, LoggerMixin):
                 QMessageBox.information(self, "Success", "Profile updated successfully")
                 
             except Exception as e:
-                self.logger.error(f"Failed to edit profile: {e}")
+                self.logger.error("Failed to edit profile: %s", e)
                 QMessageBox.critical(self, "Error", f"Failed to edit:\n{str(e)}")
     
     def delete_profile(self):
@@ -506,7 +566,7 @@ class ProfilesTab(QWidget, LoggerMixin):
                 if profile_file.exists():
                     profile_file.unlink()
                 
-                self.logger.info(f"Deleted profile: {self.current_profile.name}")
+                self.logger.info("Deleted profile: %s", self.current_profile.name)
                 
                 name = self.current_profile.name
                 self.current_profile = None
@@ -518,7 +578,7 @@ class ProfilesTab(QWidget, LoggerMixin):
                 QMessageBox.information(self, "Success", "Profile deleted")
                 
             except Exception as e:
-                self.logger.error(f"Failed to delete profile: {e}")
+                self.logger.error("Failed to delete profile: %s", e)
                 QMessageBox.critical(self, "Error", f"Failed to delete:\n{str(e)}")
     
     def add_mods_to_profile(self):
@@ -539,9 +599,9 @@ class ProfilesTab(QWidget, LoggerMixin):
         if not selected_items:
             return
         
-        for item in selected_items:
-            mod = item.data(Qt.ItemDataRole.UserRole)
-            self.current_profile.remove_mod(mod.id)
+        mod_ids = {item.data(Qt.ItemDataRole.UserRole).id for item in selected_items}
+        self.current_profile.remove_mods(mod_ids)
+        self._last_mods_sig = None
         
         self.save_current_profile()
         self.update_mods_display()
@@ -555,9 +615,11 @@ class ProfilesTab(QWidget, LoggerMixin):
         if not selected_items:
             return
         
-        for item in selected_items:
-            mod = item.data(Qt.ItemDataRole.UserRole)
-            mod.enabled = not mod.enabled
+        mod_ids = {item.data(Qt.ItemDataRole.UserRole).id for item in selected_items}
+        for mod in self.current_profile.mods:
+            if mod.id in mod_ids:
+                mod.enabled = not mod.enabled
+        self._last_mods_sig = None
         
         self.save_current_profile()
         self.update_mods_display()
@@ -579,6 +641,7 @@ class ProfilesTab(QWidget, LoggerMixin):
         
         try:
             self.current_profile.sort_by_dependencies()
+            self._last_mods_sig = None
             self.save_current_profile()
             self.update_mods_display()
             
@@ -589,7 +652,7 @@ class ProfilesTab(QWidget, LoggerMixin):
             )
             
         except Exception as e:
-            self.logger.error(f"Failed to sort: {e}")
+            self.logger.error("Failed to sort: %s", e)
             QMessageBox.critical(self, "Error", f"Failed to sort:\n{str(e)}")
     
     def export_profile(self):
@@ -644,7 +707,7 @@ class ProfilesTab(QWidget, LoggerMixin):
             profile_file = Settings.PROFILES_DIR / f"{self.current_profile.name}.json"
             self.current_profile.export_to_json(profile_file)
         except Exception as e:
-            self.logger.error(f"Failed to save profile: {e}")
+            self.logger.error("Failed to save profile: %s", e)
     
     def set_current_profile(self, profile: Profile):
         """Set current profile externally"""
@@ -3,21 +3,215 @@ Repository Tab - Manage Downloaded Mods
 """
 
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
-    QListWidget, QListWidgetItem, QPushButton, QLabel,
-    QTextEdit, QTabWidget, QMessageBox, QMenu, QInputDialog
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QSplitter, QStyle,
+    QListWidget, QListWidgetItem, QListView, QPushButton, QLabel,
+    QTextBrowser, QTabWidget, QMessageBox, QMenu, QInputDialog
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QAction
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QObject, QThread, QThreadPool, QRunnable, QTimer,
+    QAbstractListModel, QModelIndex
+)
+from PyQt6.QtGui import QAction, QIcon, QTextDocument, QTextCursor
 from pathlib import Path
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Iterator, Tuple
+import hashlib
+import os
+import re
+import string
+import threading
 import markdown
 
 from core.database import Database
 from core.models import Mod
+from utils.file_utils import format_size, safe_remove_directory
 from utils.logger import LoggerMixin
 from config.settings import Settings
 
 
+# Rating strings indexed by whole stars (0-5)
+_STARS = tuple('⭐' * i for i in range(6))
+
+# Info tab layout; all text fields are substituted pre-escaped
+_INFO_TPL = string.Template("""
+        <h3>Information</h3>
+        <table>
+        <tr><td><b>ID:</b></td><td>$id</td></tr>
+        <tr><td><b>Version:</b></td><td>$version</td></tr>
+        <tr><td><b>Author:</b></td><td>$author</td></tr>
+        <tr><td><b>Rating:</b></td><td>$rating_stars $rating</td></tr>
+        <tr><td><b>Downloads:</b></td><td>$downloads</td></tr>
+        <tr><td><b>Installed:</b></td><td>$installed</td></tr>
+        </table>
+        <h3>Description</h3>
+        <p>$description</p>
+        """)
+
+# Default stylesheet for the detail views, so rendered HTML needs no inline CSS
+_DOC_STYLE = """
+    table { margin: 4px 0; }
+    td { padding: 1px 8px 1px 0; }
+    pre, code { font-family: monospace; }
+    pre { margin: 6px 0; }
+"""
+
+# Split points for streaming large documents: after each top-level heading
+_HEADING_SPLIT = re.compile(r'(?<=</h1>)|(?<=</h2>)')
+
+
+def _iter_files_fast(root: Path) -> Iterator[Tuple[str, int]]:
+    """Yield (relative_path, size) for every file under root using one scandir walk"""
+    root_str = os.fspath(root)
+    stack = [root_str]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        yield os.path.relpath(entry.path, root_str), entry.stat().st_size
+        except OSError:
+            continue
+
+
+class _Icons:
+    """Row icons shared by the repository lists, loaded on first use"""
+    
+    mod = None
+    file = None
+    dep = None
+    
+    @classmethod
+    def load(cls, style: QStyle):
+        if cls.mod is not None:
+            return
+        
+        default_icon = Settings.RESOURCES_DIR / "icons" / "default_mod_icon.png"
+        if default_icon.exists():
+            cls.mod = QIcon(str(default_icon))
+        else:
+            cls.mod = style.standardIcon(QStyle.StandardPixmap.SP_DirIcon)
+        
+        cls.file = style.standardIcon(QStyle.StandardPixmap.SP_FileIcon)
+        cls.dep = style.standardIcon(QStyle.StandardPixmap.SP_FileLinkIcon)
+
+
+class ModListModel(QAbstractListModel):
+    """List model exposing installed mods to the repository QListView"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._mods: list[Mod] = []
+    
+    def set_mods(self, mods: list[Mod]):
+        """Replace the model contents"""
+        self.beginResetModel()
+        self._mods = list(mods)
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._mods)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        mod = self._mods[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return mod.list_text
+        if role == Qt.ItemDataRole.DecorationRole:
+            return _Icons.mod
+        if role == Qt.ItemDataRole.UserRole:
+            return mod
+        return None
+
+
+@contextmanager
+def batch_update(widget: QListWidget):
+    """Suspend repaints, signals and sorting while a list is repopulated"""
+    sorting = widget.isSortingEnabled()
+    widget.setUpdatesEnabled(False)
+    widget.blockSignals(True)
+    widget.setSortingEnabled(False)
+    try:
+        yield widget
+    finally:
+        widget.setSortingEnabled(sorting)
+        widget.blockSignals(False)
+        widget.setUpdatesEnabled(True)
+
+
+class RmTreeWorker(QThread):
+    """Worker thread for removing a deleted mod's install folder"""
+    
+    done = pyqtSignal(str, object)  # mod_id, error (None on success)
+    
+    def __init__(self, mod_id: str, path: Path, parent=None):
+        super().__init__(parent)
+        self.mod_id = mod_id
+        self.path = path
+    
+    def run(self):
+        error = None
+        if not safe_remove_directory(self.path):
+            error = OSError(f"Could not remove {self.path} (files may be in use)")
+        self.done.emit(self.mod_id, error)
+
+
+class DetailsSignals(QObject):
+    """Signals for DetailsWorker, which as a QRunnable cannot own any"""
+    
+    ready = pyqtSignal(int, str, str, object)  # token, mod_id, tab_name, payload
+
+
+class DetailsWorker(QRunnable):
+    """Pool task for reading and rendering a mod's README/changelog/files"""
+    
+    def __init__(
+        self,
+        signals: DetailsSignals,
+        token: int,
+        mod: Mod,
+        tab_name: str,
+        render_markdown
+    ):
+        super().__init__()
+        self.signals = signals
+        self.token = token
+        self.mod = mod
+        self.tab_name = tab_name
+        self.render_markdown = render_markdown
+    
+    def run(self):
+        """Build tab content in background"""
+        mod = self.mod
+        
+        if self.tab_name == 'files':
+            files = []
+            if mod.install_path and mod.install_path.exists():
+                files = sorted(_iter_files_fast(mod.install_path))
+            payload = files
+        else:
+            if self.tab_name == 'readme':
+                content = mod.get_readme_content()
+            else:
+                content = mod.get_changelog_content()
+            
+            # Empty documents are shown as plain text without invoking the parser
+            html = None
+            if content.strip():
+                try:
+                    html = self.render_markdown(content, self.tab_name)
+                except Exception:
+                    # Malformed Markdown falls back to plain text
+                    html = None
+            payload = (content, html)
+        
+        self.signals.ready.emit(self.token, mod.id, self.tab_name, payload)
+
+
 class RepositoryTab(QWidget, LoggerMixin):
     """Manage downloaded mods in repository"""
     
@@ -25,11 +219,51 @@ class RepositoryTab(QWidget, LoggerMixin):
     mod_deleted = pyqtSignal()
     mod_updated = pyqtSignal(str)  # mod_id
     
+    MD_CACHE_SIZE = 64
+    INFO_CACHE_SIZE = 64
+    LARGE_DOC_THRESHOLD = 50_000  # HTML chars above which documents are streamed
+    SELECTION_DEBOUNCE_MS = 80
+    
+    # Details tabs in display order, rendered by _render_<name> on the UI thread
+    DETAIL_TABS = ('info', 'readme', 'changelog', 'files', 'deps')
+    
+    # Tabs whose content is built by DetailsWorker and applied by _apply_<name>
+    BACKGROUND_TABS = ('readme', 'changelog', 'files')
+    
     def __init__(self, database: Database):
         super().__init__()
         self.db = database
         self.current_mods = []
+        self._mods_by_id: dict[str, Mod] = {}
+        self._updatable: list[Mod] = []
         self.selected_mod = None
+        self._pending_mod = None
+        
+        # Rendered Markdown keyed by content hash (LRU)
+        self._md_cache: OrderedDict[str, str] = OrderedDict()
+        self._md_lock = threading.Lock()
+        
+        # One converter reused for every document; not thread-safe, so
+        # conversions are serialised on its own lock
+        self._md = markdown.Markdown(extensions=['extra', 'sane_lists'], output_format='html5')
+        self._md_convert_lock = threading.Lock()
+        
+        # Info tab HTML keyed by the mod fields it shows (LRU)
+        self._info_html_cache: OrderedDict[tuple, str] = OrderedDict()
+        
+        # Detail tabs are built on a small pool owned by the tab. Each
+        # selection gets a new token; results carrying an older one are dropped.
+        self._details_pool = QThreadPool(self)
+        self._details_pool.setMaxThreadCount(2)
+        self._details_signals = DetailsSignals(self)
+        self._details_signals.ready.connect(self._on_details_ready)
+        self._details_token = 0
+        
+        # Folder removals in progress, keyed by mod id with the deleted Mod
+        self._delete_workers: dict[str, tuple[RmTreeWorker, Mod]] = {}
+        
+        # (mod_id, tab_name) pairs already rendered for the current selection
+        self._rendered: set[tuple[str, str]] = set()
         
         self.setup_ui()
         self.load_mods()
@@ -55,6 +289,12 @@ class RepositoryTab(QWidget, LoggerMixin):
         
         splitter.setSizes([300, 700])
         layout.addWidget(splitter)
+        
+        # Coalesce rapid selection changes (e.g. holding an arrow key)
+        self._select_timer = QTimer(self)
+        self._select_timer.setSingleShot(True)
+        self._select_timer.setInterval(self.SELECTION_DEBOUNCE_MS)
+        self._select_timer.timeout.connect(self._apply_pending_selection)
     
     def create_header(self) -> QWidget:
         """Create header with count and actions"""
@@ -100,15 +340,45 @@ class RepositoryTab(QWidget, LoggerMixin):
         filter_layout.addStretch()
         layout.addWidget(filter_widget)
         
-        # List widget
-        self.mod_list = QListWidget()
+        # List view backed by the mod model
+        self.model = ModListModel(self)
+        self.mod_list = QListView()
+        self.mod_list.setModel(self.model)
         self.mod_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.mod_list.customContextMenuRequested.connect(self.show_context_menu)
-        self.mod_list.currentItemChanged.connect(self.on_mod_selected)
+        self.mod_list.selectionModel().currentChanged.connect(self.on_mod_selected)
         layout.addWidget(self.mod_list)
         
+        self.create_context_menu()
+        
         return widget
     
+    def create_context_menu(self):
+        """Build the mod list context menu once; show_context_menu toggles actions"""
+        self._ctx_menu = QMenu(self)
+        
+        # Open folder action
+        self._open_action = QAction("📂 Open Folder", self)
+        self._open_action.triggered.connect(self.open_mod_folder)
+        self._ctx_menu.addAction(self._open_action)
+        
+        # Edit config action
+        self._config_action = QAction("⚙️ Edit Config", self)
+        self._config_action.triggered.connect(self.edit_mod_config)
+        self._ctx_menu.addAction(self._config_action)
+        
+        self._ctx_menu.addSeparator()
+        
+        # Update action
+        self._update_action = QAction("⬆️ Update", self)
+        self._update_action.triggered.connect(self.update_selected_mod)
+        self._ctx_menu.addAction(self._update_action)
+        
+        # Delete action
+        self._delete_action = QAction("🗑️ Delete", self)
+        self._delete_action.triggered.connect(self.delete_selected_mod)
+        self._ctx_menu.addAction(self._delete_action)
+    
     def create_details_panel(self) -> QWidget:
         """Create details panel"""
         widget = QWidget()
@@ -124,18 +394,16 @@ class RepositoryTab(QWidget, LoggerMixin):
         self.details_tabs = QTabWidget()
         
         # Info tab
-        self.info_text = QTextEdit()
-        self.info_text.setReadOnly(True)
+        self.info_text = self.create_text_view()
+        self.info_text.setAcceptRichText(False)
         self.details_tabs.addTab(self.info_text, "📋 Info")
         
         # README tab
-        self.readme_view = QTextEdit()
-        self.readme_view.setReadOnly(True)
+        self.readme_view = self.create_text_view()
         self.details_tabs.addTab(self.readme_view, "📖 README")
         
         # Changelog tab
-        self.changelog_view = QTextEdit()
-        self.changelog_view.setReadOnly(True)
+        self.changelog_view = self.create_text_view()
         self.details_tabs.addTab(self.changelog_view, "📝 Changelog")
         
         # Files tab
@@ -146,6 +414,8 @@ class RepositoryTab(QWidget, LoggerMixin):
         self.deps_list = QListWidget()
         self.details_tabs.addTab(self.deps_list, "🔗 Dependencies")
         
+        self.details_tabs.currentChanged.connect(self._on_tab_changed)
+        
         layout.addWidget(self.details_tabs)
         
         # Action buttons
@@ -178,6 +448,59 @@ class RepositoryTab(QWidget, LoggerMixin):
         
         return widget
     
+    def create_text_view(self) -> QTextBrowser:
+        """Create a read-only HTML view without undo history"""
+        view = QTextBrowser()
+        view.setUndoRedoEnabled(False)
+        view.setTabChangesFocus(True)
+        view.setOpenExternalLinks(True)
+        self.configure_document(view.document())
+        return view
+    
+    def configure_document(self, doc: QTextDocument):
+        """Apply the shared detail-view document settings"""
+        doc.setUndoRedoEnabled(False)
+        doc.setDefaultStyleSheet(_DOC_STYLE)
+    
+    def set_view_html(self, view: QTextBrowser, html: str):
+        """Replace a view's HTML with repaints and signals suspended"""
+        view.setUpdatesEnabled(False)
+        view.blockSignals(True)
+        try:
+            view.setHtml(html)
+        finally:
+            view.blockSignals(False)
+            view.setUpdatesEnabled(True)
+    
+    def show_document(self, view: QTextBrowser, html: str):
+        """Show HTML in a view, inserting large documents one section at a time"""
+        if len(html) <= self.LARGE_DOC_THRESHOLD:
+            self.set_view_html(view, html)
+            return
+        
+        mod_id = self.selected_mod.id if self.selected_mod else None
+        
+        doc = QTextDocument(view)
+        self.configure_document(doc)
+        cursor = QTextCursor(doc)
+        
+        for chunk in _HEADING_SPLIT.split(html):
+            if not chunk:
+                continue
+            
+            cursor.insertHtml(chunk)
+            QApplication.processEvents()
+            
+            # Selection moved on while the event loop ran
+            if not self.selected_mod or self.selected_mod.id != mod_id:
+                doc.deleteLater()
+                return
+        
+        old_doc = view.document()
+        view.setDocument(doc)
+        if old_doc.parent() is view:
+            old_doc.deleteLater()
+    
     def load_mods(self):
         """Load installed mods from database"""
         try:
@@ -185,24 +508,26 @@ class RepositoryTab(QWidget, LoggerMixin):
             
             # Get all installed mods
             self.current_mods = self.db.get_all_mods(installed_only=True)
+            self._mods_by_id = {m.id: m for m in self.current_mods}
+            self._updatable = [m for m in self.current_mods if m.update_available]
             
-            # Update list
-            self.mod_list.clear()
+            # Reset the model, keeping scroll position
+            scroll_bar = self.mod_list.verticalScrollBar()
+            scroll_pos = scroll_bar.value()
             
-            for mod in self.current_mods:
-                item = QListWidgetItem()
-                
-                # Set text
-                text = f"🎨 {mod.name}\n"
-                text += f"   v{mod.version} by {mod.author}\n"
-                
-                if mod.update_available:
-                    text += "   ⬆️ Update available"
-                
-                item.setText(text)
-                item.setData(Qt.ItemDataRole.UserRole, mod)
-                
-                self.mod_list.addItem(item)
+            _Icons.load(self.style())
+            self.model.set_mods(self.current_mods)
+            
+            # Restore the selection without re-rendering the details
+            if self.selected_mod is not None and self.selected_mod.id in self._mods_by_id:
+                self.selected_mod = self._mods_by_id[self.selected_mod.id]
+                row = self.current_mods.index(self.selected_mod)
+                selection = self.mod_list.selectionModel()
+                selection.blockSignals(True)
+                self.mod_list.setCurrentIndex(self.model.index(row))
+                selection.blockSignals(False)
+            
+            scroll_bar.setValue(scroll_pos)
             
             # Update count
             self.count_label.setText(f"Installed Mods: {len(self.current_mods)}")
@@ -213,12 +538,31 @@ class RepositoryTab(QWidget, LoggerMixin):
             self.logger.error(f"Failed to load mods: {e}")
             QMessageBox.warning(self, "Error", f"Failed to load mods:\n{str(e)}")
     
-    def on_mod_selected(self, current, previous):
+    def on_mod_selected(self, current: QModelIndex, previous: QModelIndex):
         """Handle mod selection"""
-        if not current:
+        if not current.isValid():
             return
         
         mod = current.data(Qt.ItemDataRole.UserRole)
+        
+        # Re-selecting the mod already shown (or about to be) is a no-op
+        target = self._pending_mod or self.selected_mod
+        if target is not None and mod.id == target.id:
+            return
+        
+        self._pending_mod = mod
+        
+        # Header updates immediately, the rest once selection settles
+        self.update_header(mod)
+        self._select_timer.start()
+    
+    def _apply_pending_selection(self):
+        """Show details for the last mod selected before the debounce timer fired"""
+        mod = self._pending_mod
+        if mod is None:
+            return
+        
+        self._pending_mod = None
         self.selected_mod = mod
         
         # Update details
@@ -230,111 +574,207 @@ class RepositoryTab(QWidget, LoggerMixin):
         self.update_btn.setEnabled(mod.update_available)
         self.delete_btn.setEnabled(True)
     
-    def update_details(self, mod: Mod):
-        """Update details panel"""
-        # Update header
+    def _disable_mod_actions(self):
+        """Disable the per-mod action buttons (nothing selected)"""
+        self.open_folder_btn.setEnabled(False)
+        self.edit_config_btn.setEnabled(False)
+        self.update_btn.setEnabled(False)
+        self.delete_btn.setEnabled(False)
+    
+    def _clear_details(self):
+        """Reset the details panel to its nothing-selected state"""
+        self._rendered.clear()
+        self._details_token += 1
+        self._details_pool.clear()
+        self.info_label.setText("<h2>Select a mod to view details</h2>")
+        self.info_text.clear()
+        self.readme_view.clear()
+        self.changelog_view.clear()
+        self.files_list.clear()
+        self.deps_list.clear()
+    
+    def _select_mod_row(self, mod_id: str):
+        """Select a mod in the list by id, showing its details"""
+        mod = self._mods_by_id.get(mod_id)
+        if mod is not None:
+            self.mod_list.setCurrentIndex(self.model.index(self.current_mods.index(mod)))
+    
+    def update_header(self, mod: Mod):
+        """Update details header"""
+        escaped = mod._escaped
         self.info_label.setText(
-            f"<h2>{mod.name}</h2>"
-            f"<p>by {mod.author} • v{mod.version}</p>"
+            f"<h2>{escaped['name']}</h2>"
+            f"<p>by {escaped['author']} • v{escaped['version']}</p>"
         )
+    
+    def update_details(self, mod: Mod):
+        """Update details panel"""
+        self.update_header(mod)
+        
+        # Only the visible tab is rendered now, the rest on first view;
+        # queued work for the previous selection is dropped
+        self._rendered.clear()
+        self._details_token += 1
+        self._details_pool.clear()
+        self._render_current_tab()
+    
+    def _on_tab_changed(self, index: int):
+        """Render a details tab the first time it is shown for the selected mod"""
+        self._render_current_tab()
+    
+    def _render_current_tab(self):
+        """Render the visible details tab if not already done for the selected mod"""
+        mod = self.selected_mod
+        if not mod:
+            return
         
-        # Info tab
-        info_html = f"""
-        <h3>Information</h3>
-        <table>
-        <tr><td><b>ID:</b></td><td>{mod.id}</td></tr>
-        <tr><td><b>Version:</b></td><td>{mod.version}</td></tr>
-        <tr><td><b>Author:</b></td><td>{mod.author}</td></tr>
-        <tr><td><b>Rating:</b></td><td>{'⭐' * int(mod.rating)} {mod.rating:.1f}</td></tr>
-        <tr><td><b>Downloads:</b></td><td>{mod.downloads:,}</td></tr>
-        <tr><td><b>Installed:</b></td><td>{mod.downloaded_at.strftime('%Y-%m-%d %H:%M') if mod.downloaded_at else 'Unknown'}</td></tr>
-        </table>
-        <h3>Description</h3>
-        <p>{mod.description}</p>
-        """
+        index = self.details_tabs.currentIndex()
+        if index < 0:
+            return
         
-        if mod.full_description:
-            info_html += f"<h3>Full Description</h3><p>{mod.full_description}</p>"
+        name = self.DETAIL_TABS[index]
+        if (mod.id, name) in self._rendered:
+            return
         
-        self.info_text.setHtml(info_html)
+        self._rendered.add((mod.id, name))
         
-        # README tab
-        readme_content = mod.get_readme_content()
-        try:
-            readme_html = markdown.markdown(readme_content)
-            self.readme_view.setHtml(readme_html)
-        except:
-            self.readme_view.setPlainText(readme_content)
+        if name in self.BACKGROUND_TABS:
+            self._start_details_worker(mod, name)
+        else:
+            getattr(self, f"_render_{name}")(mod)
+    
+    def _start_details_worker(self, mod: Mod, name: str):
+        """Build a tab's content off the UI thread"""
+        placeholder = {
+            'readme': self.readme_view,
+            'changelog': self.changelog_view,
+        }.get(name)
+        if placeholder is not None:
+            placeholder.setPlainText("Loading...")
+        
+        self._details_pool.start(DetailsWorker(
+            self._details_signals, self._details_token, mod, name, self.render_markdown
+        ))
+    
+    def _on_details_ready(self, token: int, mod_id: str, name: str, payload):
+        """Apply worker output unless the selection has moved on"""
+        if (
+            token != self._details_token
+            or not self.selected_mod
+            or self.selected_mod.id != mod_id
+        ):
+            return
         
-        # Changelog tab
-        changelog_content = mod.get_changelog_content()
-        try:
-            changelog_html = markdown.markdown(changelog_content)
-            self.changelog_view.setHtml(changelog_html)
-        except:
-            self.changelog_view.setPlainText(changelog_content)
+        getattr(self, f"_apply_{name}")(payload)
+    
+    def _render_info(self, mod: Mod):
+        """Render Info tab"""
+        key = (
+            mod.id, mod.name, mod.version, mod.author, mod.update_available,
+            mod.description, mod.full_description,
+            mod.rating, mod.downloads, mod.downloaded_at
+        )
+        info_html = self._info_html_cache.get(key)
+        if info_html is None:
+            info_html = self._build_info_html(mod)
+            self._info_html_cache[key] = info_html
+            if len(self._info_html_cache) > self.INFO_CACHE_SIZE:
+                self._info_html_cache.popitem(last=False)  # Remove oldest
+        else:
+            self._info_html_cache.move_to_end(key)
         
-        # Files tab
-        self.files_list.clear()
-        files = mod.get_file_list()
-        for file_path in files:
-            try:
-                rel_path = file_path.relative_to(mod.install_path)
-                size = file_path.stat().st_size
-                size_str = self.format_size(size)
-                item = QListWidgetItem(f"📄 {rel_path} ({size_str})")
-                self.files_list.addItem(item)
-            except:
-                pass
+        self.set_view_html(self.info_text, info_html)
+    
+    def _build_info_html(self, mod: Mod) -> str:
+        """Build Info tab HTML"""
+        escaped = mod._escaped
+        info_html = _INFO_TPL.substitute(
+            escaped,
+            rating_stars=_STARS[min(5, max(0, int(mod.rating)))],
+            rating=f"{mod.rating:.1f}",
+            downloads=f"{mod.downloads:,}",
+            installed=mod.downloaded_at.strftime('%Y-%m-%d %H:%M') if mod.downloaded_at else 'Unknown'
+        )
         
-        if not files:
-            self.files_list.addItem(QListWidgetItem("No files found"))
+        if mod.full_description:
+            info_html += f"<h3>Full Description</h3><p>{escaped['full_description']}</p>"
         
-        # Dependencies tab
-        self.deps_list.clear()
-        if mod.dependencies:
-            for dep in mod.dependencies:
-                constraint = dep.version_constraint if dep.version_constraint != "*" else "any version"
-                item = QListWidgetItem(f"🔗 {dep.mod_id} ({constraint})")
-                self.deps_list.addItem(item)
+        return info_html
+    
+    def _apply_readme(self, payload):
+        """Show README tab content"""
+        content, html = payload
+        if html is None:
+            self.readme_view.setPlainText(content)
         else:
-            self.deps_list.addItem(QListWidgetItem("No dependencies"))
+            self.show_document(self.readme_view, html)
+    
+    def _apply_changelog(self, payload):
+        """Show Changelog tab content"""
+        content, html = payload
+        if html is None:
+            self.changelog_view.setPlainText(content)
+        else:
+            self.show_document(self.changelog_view, html)
+    
+    def _apply_files(self, files):
+        """Show Files tab content"""
+        with batch_update(self.files_list):
+            self.files_list.clear()
+            for rel_path, size in files:
+                size_str = self.format_size(size)
+                self.files_list.addItem(QListWidgetItem(_Icons.file, f"{rel_path} ({size_str})"))
+            
+            if not files:
+                self.files_list.addItem(QListWidgetItem("No files found"))
+    
+    def _render_deps(self, mod: Mod):
+        """Render Dependencies tab"""
+        with batch_update(self.deps_list):
+            self.deps_list.clear()
+            if mod.dependencies:
+                for dep in mod.dependencies:
+                    constraint = dep.version_constraint if dep.version_constraint != "*" else "any version"
+                    item = QListWidgetItem(_Icons.dep, f"{dep.mod_id} ({constraint})")
+                    self.deps_list.addItem(item)
+            else:
+                self.deps_list.addItem(QListWidgetItem("No dependencies"))
+    
+    def render_markdown(self, content: str, kind: str) -> str:
+        """Convert Markdown to HTML, reusing earlier results for identical content"""
+        key = kind + ':' + hashlib.blake2b(content.encode(), digest_size=8).hexdigest()
+        
+        # Called from DetailsWorker threads
+        with self._md_lock:
+            html = self._md_cache.get(key)
+            if html is not None:
+                self._md_cache.move_to_end(key)
+                return html
+        
+        with self._md_convert_lock:
+            html = self._md.reset().convert(content)
+        
+        with self._md_lock:
+            self._md_cache[key] = html
+            if len(self._md_cache) > self.MD_CACHE_SIZE:
+                self._md_cache.popitem(last=False)  # Remove oldest
+        
+        return html
     
     def show_context_menu(self, position):
         """Show context menu for mod list"""
-        item = self.mod_list.itemAt(position)
-        if not item:
+        index = self.mod_list.indexAt(position)
+        if not index.isValid():
             return
         
-        mod = item.data(Qt.ItemDataRole.UserRole)
-        
-        menu = QMenu()
-        
-        # Open folder action
-        open_action = QAction("📂 Open Folder", self)
-        open_action.triggered.connect(self.open_mod_folder)
-        menu.addAction(open_action)
-        
-        # Edit config action
-        if mod.config_files:
-            config_action = QAction("⚙️ Edit Config", self)
-            config_action.triggered.connect(self.edit_mod_config)
-            menu.addAction(config_action)
-        
-        menu.addSeparator()
-        
-        # Update action
-        if mod.update_available:
-            update_action = QAction("⬆️ Update", self)
-            update_action.triggered.connect(self.update_selected_mod)
-            menu.addAction(update_action)
+        # Actions apply to the row that was right-clicked
+        mod = index.data(Qt.ItemDataRole.UserRole)
+        self.selected_mod = mod
         
-        # Delete action
-        delete_action = QAction("🗑️ Delete", self)
-        delete_action.triggered.connect(self.delete_selected_mod)
-        menu.addAction(delete_action)
+        self._config_action.setVisible(bool(mod.config_files))
+        self._update_action.setVisible(mod.update_available)
         
-        menu.exec(self.mod_list.mapToGlobal(position))
+        self._ctx_menu.exec(self.mod_list.mapToGlobal(position))
     
     def open_mod_folder(self):
         """Open mod folder in file explorer"""
@@ -387,7 +827,7 @@ class RepositoryTab(QWidget, LoggerMixin):
     
     def delete_selected_mod(self):
         """Delete selected mod"""
-        if not self.selected_mod:
+        if not self.selected_mod or self.selected_mod.id in self._delete_workers:
             return
         
         reply = QMessageBox.question(
@@ -399,28 +839,32 @@ class RepositoryTab(QWidget, LoggerMixin):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
+            mod = self.selected_mod
             try:
-                # Delete from database
-                self.db.delete_mod(self.selected_mod.id)
-                
-                # Delete files
-                if self.selected_mod.install_path and self.selected_mod.install_path.exists():
-                    import shutil
-                    shutil.rmtree(self.selected_mod.install_path)
-                
-                self.logger.info(f"Deleted mod: {self.selected_mod.id}")
+                # The mod is going away: drop the selection, its actions
+                # and the details still showing it
+                self.selected_mod = None
+                self._pending_mod = None
+                self._disable_mod_actions()
+                self._clear_details()
                 
-                # Reload list
+                # Delete from database; the list updates right away
+                self.db.delete_mod(mod.id)
                 self.load_mods()
                 
-                # Emit signal
-                self.mod_deleted.emit()
-                
-                QMessageBox.information(
-                    self,
-                    "Success",
-                    f"Mod '{self.selected_mod.name}' deleted successfully"
-                )
+                # Delete files in the background; the entry stays until the
+                # thread has finished so repeat requests are ignored
+                if mod.install_path and mod.install_path.exists():
+                    worker = RmTreeWorker(mod.id, mod.install_path, parent=self)
+                    worker.done.connect(self._on_mod_files_deleted)
+                    worker.finished.connect(
+                        lambda mod_id=mod.id: self._delete_workers.pop(mod_id, None)
+                    )
+                    worker.finished.connect(worker.deleteLater)
+                    self._delete_workers[mod.id] = (worker, mod)
+                    worker.start()
+                else:
+                    self._on_mod_files_deleted(mod.id, None, mod)
                 
             except Exception as e:
                 self.logger.error(f"Failed to delete mod: {e}")
@@ -430,9 +874,43 @@ class RepositoryTab(QWidget, LoggerMixin):
                     f"Failed to delete mod:\n{str(e)}"
                 )
     
+    def _on_mod_files_deleted(self, mod_id: str, error, mod: Mod = None):
+        """Finish a mod deletion once its folder is gone, restoring it on failure"""
+        if mod is None:
+            entry = self._delete_workers.get(mod_id)
+            if entry is None:
+                return
+            mod = entry[1]
+        
+        if error is not None:
+            self.logger.error(f"Failed to delete mod: {error}")
+            self.db.save_mod(mod)
+            self.load_mods()
+            
+            # Show the restored mod again unless another one was picked meanwhile
+            if self.selected_mod is None and self._pending_mod is None:
+                self._select_mod_row(mod_id)
+            QMessageBox.critical(
+                self,
+                "Error",
+                f"Failed to delete mod:\n{str(error)}"
+            )
+            return
+        
+        self.logger.info(f"Deleted mod: {mod_id}")
+        
+        # Emit signal
+        self.mod_deleted.emit()
+        
+        QMessageBox.information(
+            self,
+            "Success",
+            f"Mod '{mod.name}' deleted successfully"
+        )
+    
     def update_all_mods(self):
         """Update all mods that have updates available"""
-        updates = [m for m in self.current_mods if m.update_available]
+        updates = self._updatable
         
         if not updates:
             QMessageBox.information(
@@ -454,10 +932,13 @@ class RepositoryTab(QWidget, LoggerMixin):
             # TODO: Implement batch update
             QMessageBox.information(self, "Update", "Batch update not yet implemented")
     
+    def shutdown(self):
+        """Wait for background work to finish before the tab is destroyed"""
+        self._details_pool.clear()
+        self._details_pool.waitForDone()
+        for worker, _ in list(self._delete_workers.values()):
+            worker.wait()
+    
     def format_size(self, bytes_size: int) -> str:
         """Format file size"""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if bytes_size < 1024.0:
-                return f"{bytes_size:.1f} {unit}"
-            bytes_size /= 1024.0
-        return f"{bytes_size:.1f} TB"
+        return format_size(bytes_size)
@@ -8,13 +8,113 @@ from PyQt6.QtWidgets import (
     QCheckBox, QComboBox, QFileDialog, QMessageBox,
     QScrollArea, QFormLayout
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QThread, QTimer, QUrl, QSignalBlocker, QEvent
+from PyQt6.QtGui import QDesktopServices
 from pathlib import Path
+from typing import Optional
+import os
 
 from core.database import Database
 from services.game_launcher import GameLauncher
 from utils.logger import LoggerMixin, cleanup_old_logs
 from config.settings import Settings
+from utils.validators import validate_game_path
+
+
+# Starting directory for the game path browser
+_HOME = str(Path.home())
+
+# Launch option bits packed into the 'launch_flags' setting
+FLAG_CONSOLE = 1
+FLAG_SKIPINTRO = 2
+FLAG_WINDOWED = 4
+FLAG_STEAM = 8
+
+# App info shown in the About section; built once since it only uses constants
+_ABOUT_HTML = f"""
+<h3>{Settings.APP_NAME}</h3>
+<p><b>Version:</b> {Settings.VERSION}</p>
+<p><b>Author:</b> Your Name</p>
+<p><b>License:</b> MIT License</p>
+<br>
+<p>A modern mod manager for Valheim with smart deployment,
+dependency resolution, and profile management.</p>
+"""
+
+
+def _fast_clear(root: Path):
+    """Empty a directory in place, walking it iteratively with os.scandir"""
+    root = os.fspath(root)
+    stack = [(root, False)]
+    while stack:
+        path, emptied = stack.pop()
+        if emptied:
+            os.rmdir(path)
+            continue
+        
+        # Revisit subdirectories to remove them once their children are gone
+        if path != root:
+            stack.append((path, True))
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, False))
+                else:
+                    os.unlink(entry.path)
+
+
+class ClearCacheWorker(QThread):
+    """Worker thread for emptying the cache and temp directories"""
+    
+    done = pyqtSignal(bool, str)  # success, error
+    
+    def run(self):
+        """Clear directories in background"""
+        try:
+            for directory in (Settings.CACHE_DIR, Settings.TEMP_DIR):
+                if directory.exists():
+                    _fast_clear(directory)
+            
+            self.done.emit(True, "")
+            
+        except Exception as e:
+            self.done.emit(False, str(e))
+
+
+class DetectGameWorker(QThread):
+    """Worker thread for auto-detecting the game installation"""
+    
+    detected = pyqtSignal(object, str)  # game path (or None), error
+    
+    def __init__(self, game_launcher: GameLauncher):
+        super().__init__()
+        self.game_launcher = game_launcher
+    
+    def run(self):
+        """Search for the game in background"""
+        try:
+            self.detected.emit(self.game_launcher.find_game_path(), "")
+        except Exception as e:
+            self.detected.emit(None, str(e))
+
+
+class GamePathWorker(QThread):
+    """Worker thread for validating the game path before saving"""
+    
+    validated = pyqtSignal(str, bool, str)  # path, is_valid, error
+    
+    def __init__(self, game_path: str):
+        super().__init__()
+        self.game_path = game_path
+    
+    def run(self):
+        """Validate path in background"""
+        try:
+            is_valid, error = validate_game_path(Path(self.game_path))
+        except Exception as e:
+            is_valid, error = False, str(e)
+        
+        self.validated.emit(self.game_path, is_valid, error or "")
 
 
 class SettingsTab(QWidget, LoggerMixin):
@@ -22,27 +122,111 @@ class SettingsTab(QWidget, LoggerMixin):
     
     settings_changed = pyqtSignal()
     
+    # Delay before the content width follows a resize
+    RESIZE_DEBOUNCE_MS = 50
+    # Window in which repeated saves are reported as one settings_changed
+    EMIT_DEBOUNCE_MS = 50
+    
+    # Launch option checkboxes: (flag bit, checkbox attribute, pre-bitmask setting key)
+    LAUNCH_FLAGS = (
+        (FLAG_CONSOLE, 'console_checkbox', 'launch_console'),
+        (FLAG_SKIPINTRO, 'skipintro_checkbox', 'launch_skipintro'),
+        (FLAG_WINDOWED, 'windowed_checkbox', 'launch_windowed'),
+        (FLAG_STEAM, 'steam_launch_checkbox', 'launch_via_steam'),
+    )
+    
+    # Checkbox settings saved as 'true'/'false': (setting key, checkbox attribute)
+    BOOL_FIELDS = (
+        ('auto_backup', 'auto_backup_checkbox'),
+        ('auto_update', 'auto_update_checkbox'),
+        ('auto_resolve_deps', 'auto_resolve_checkbox'),
+        ('conflict_detection', 'conflict_detection_checkbox'),
+    )
+    
     def __init__(self, database: Database):
         super().__init__()
         self.db = database
         self.game_launcher = GameLauncher()
+        self.validate_worker = None
+        self.clear_cache_worker = None
+        self.detect_worker = None
+        self._browse_dialog = None
+        
+        # Stored setting values, used to save only what changed
+        self._initial: dict[str, str] = {}
+        
+        # Groups are built the first time the tab is shown
+        self._built = False
+        
+        # settings_changed is emitted through this timer so that bursts of
+        # saves reach listeners once
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(self.EMIT_DEBOUNCE_MS)
+        self._emit_timer.timeout.connect(self.settings_changed)
         
         self.setup_ui()
-        self.load_settings()
     
     def setup_ui(self):
-        """Setup user interface"""
+        """Setup user interface; only the scroll area until first shown"""
         # Main scroll area
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(QScrollArea.Shape.NoFrame)
+        self.scroll = QScrollArea()
+        self.scroll.setWidgetResizable(True)
+        self.scroll.setFrameShape(QScrollArea.Shape.NoFrame)
+        self.scroll.viewport().setAttribute(Qt.WidgetAttribute.WA_StaticContents, True)
+        
+        # Content is re-laid out once a viewport resize settles, not on every
+        # step. Watching the viewport (not the tab) also catches the vertical
+        # scrollbar appearing or disappearing.
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(self.RESIZE_DEBOUNCE_MS)
+        self._resize_timer.timeout.connect(self._apply_content_width)
+        self.scroll.viewport().installEventFilter(self)
         
-        # Content widget
+        # Main layout
+        main_layout = QVBoxLayout(self)
+        main_layout.setContentsMargins(0, 0, 0, 0)
+        main_layout.addWidget(self.scroll)
+    
+    def showEvent(self, event):
+        """Build the settings groups and load values on first show"""
+        if not self._built:
+            self._built = True
+            self._build_ui()
+            self.load_settings()
+        
+        super().showEvent(event)
+    
+    def eventFilter(self, obj, event):
+        """Debounce content relayout while the scroll viewport is resized"""
+        if event.type() == QEvent.Type.Resize and obj is self.scroll.viewport():
+            self._resize_timer.start()
+        return super().eventFilter(obj, event)
+    
+    def _apply_content_width(self):
+        """Fix the content width to the viewport's width (never below its minimum)"""
+        content = self.scroll.widget()
+        if content is not None:
+            content.setFixedWidth(max(
+                self.scroll.viewport().width(),
+                content.layout().minimumSize().width()
+            ))
+    
+    def _build_ui(self):
+        """Build the settings groups into the scroll area"""
+        # Content widget; repaints held off until every group is in place
         content = QWidget()
+        content.setUpdatesEnabled(False)
         layout = QVBoxLayout(content)
         
         # Title
-        title = QLabel("<h2>⚙️ Settings</h2>")
+        title = QLabel("⚙️ Settings")
+        title.setTextFormat(Qt.TextFormat.PlainText)
+        font = title.font()
+        font.setPointSize(16)
+        font.setBold(True)
+        title.setFont(font)
         layout.addWidget(title)
         
         # Game settings
@@ -68,17 +252,14 @@ class SettingsTab(QWidget, LoggerMixin):
         layout.addStretch()
         
         # Save button
-        save_btn = QPushButton("💾 Save Settings")
-        save_btn.setMinimumHeight(40)
-        save_btn.clicked.connect(self.save_settings)
-        layout.addWidget(save_btn)
-        
-        scroll.setWidget(content)
-        
-        # Main layout
-        main_layout = QVBoxLayout(self)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.addWidget(scroll)
+        self.save_btn = QPushButton("💾 Save Settings")
+        self.save_btn.setMinimumHeight(40)
+        self.save_btn.clicked.connect(self.save_settings)
+        layout.addWidget(self.save_btn)
+        
+        self.scroll.setWidget(content)
+        self._apply_content_width()
+        content.setUpdatesEnabled(True)
     
     def create_game_settings(self) -> QGroupBox:
         """Create game settings group"""
@@ -98,9 +279,9 @@ class SettingsTab(QWidget, LoggerMixin):
         browse_btn.clicked.connect(self.browse_game_path)
         game_path_layout.addWidget(browse_btn)
         
-        detect_btn = QPushButton("🔍 Auto-detect")
-        detect_btn.clicked.connect(self.auto_detect_game)
-        game_path_layout.addWidget(detect_btn)
+        self.detect_btn = QPushButton("🔍 Auto-detect")
+        self.detect_btn.clicked.connect(self.auto_detect_game)
+        game_path_layout.addWidget(self.detect_btn)
         
         layout.addRow("Game Path:", game_path_widget)
         
@@ -260,17 +441,7 @@ class SettingsTab(QWidget, LoggerMixin):
         layout = QVBoxLayout()
         
         # App info
-        info_html = f"""
-        <h3>{Settings.APP_NAME}</h3>
-        <p><b>Version:</b> {Settings.VERSION}</p>
-        <p><b>Author:</b> Your Name</p>
-        <p><b>License:</b> MIT License</p>
-        <br>
-        <p>A modern mod manager for Valheim with smart deployment,
-        dependency resolution, and profile management.</p>
-        """
-        
-        info_label = QLabel(info_html)
+        info_label = QLabel(_ABOUT_HTML)
         info_label.setWordWrap(True)
         layout.addWidget(info_label)
         
@@ -278,34 +449,25 @@ class SettingsTab(QWidget, LoggerMixin):
         links_widget = QWidget()
         links_layout = QHBoxLayout(links_widget)
         
-        github_btn = QPushButton("🌐 GitHub")
-        github_btn.clicked.connect(
-            lambda: self.open_url("https://github.com/yourusername/valheim-mod-manager")
-        )
-        links_layout.addWidget(github_btn)
-        
-        docs_btn = QPushButton("📚 Documentation")
-        docs_btn.clicked.connect(
-            lambda: self.open_url("https://github.com/yourusername/valheim-mod-manager/wiki")
-        )
-        links_layout.addWidget(docs_btn)
-        
-        discord_btn = QPushButton("💬 Discord")
-        discord_btn.clicked.connect(
-            lambda: self.open_url("https://discord.gg/example")
-        )
-        links_layout.addWidget(discord_btn)
+        for text, url in [
+            ("🌐 GitHub", "https://github.com/yourusername/valheim-mod-manager"),
+            ("📚 Documentation", "https://github.com/yourusername/valheim-mod-manager/wiki"),
+            ("💬 Discord", "https://discord.gg/example"),
+        ]:
+            link_btn = QPushButton(text)
+            link_btn.setProperty("url", url)
+            link_btn.clicked.connect(self._open_sender_url)
+            links_layout.addWidget(link_btn)
         
         links_layout.addStretch()
         
         layout.addWidget(links_widget)
         
         # Data directories
-        dirs_widget = QWidget()
-        dirs_layout = QVBoxLayout(dirs_widget)
-        
         dirs_title = QLabel("<b>Data Directories:</b>")
-        dirs_layout.addWidget(dirs_title)
+        layout.addWidget(dirs_title)
+        
+        dirs_layout = QFormLayout()
         
         for name, path in [
             ("Data", Settings.DATA_DIR),
@@ -314,27 +476,21 @@ class SettingsTab(QWidget, LoggerMixin):
             ("Logs", Settings.LOGS_DIR),
             ("Backups", Settings.BACKUPS_DIR),
         ]:
-            dir_widget = QWidget()
-            dir_layout = QHBoxLayout(dir_widget)
-            dir_layout.setContentsMargins(0, 0, 0, 0)
-            
-            dir_label = QLabel(f"{name}:")
-            dir_label.setMinimumWidth(80)
-            dir_layout.addWidget(dir_label)
-            
             dir_path = QLabel(str(path))
             dir_path.setStyleSheet("color: #888;")
-            dir_layout.addWidget(dir_path)
-            
-            dir_layout.addStretch()
             
             open_btn = QPushButton("📂 Open")
-            open_btn.clicked.connect(lambda checked, p=path: self.open_directory(p))
-            dir_layout.addWidget(open_btn)
+            open_btn.setProperty("path", str(path))
+            open_btn.clicked.connect(self._open_sender_dir)
+            
+            row = QHBoxLayout()
+            row.addWidget(dir_path)
+            row.addStretch()
+            row.addWidget(open_btn)
             
-            dirs_layout.addWidget(dir_widget)
+            dirs_layout.addRow(f"{name}:", row)
         
-        layout.addWidget(dirs_widget)
+        layout.addLayout(dirs_layout)
         
         group.setLayout(layout)
         return group
@@ -342,24 +498,34 @@ class SettingsTab(QWidget, LoggerMixin):
     def load_settings(self):
         """Load settings from database"""
         try:
+            self._initial = dict(self.db.get_all_settings())
+            
+            # No change signals while widgets are filled; released on return
+            blockers = [
+                QSignalBlocker(widget) for widget in (
+                    self.game_path_input,
+                    self.theme_combo,
+                    *(getattr(self, attr) for _, attr, _ in self.LAUNCH_FLAGS),
+                )
+            ]
+            
             # Game path
             game_path = self.db.get_setting('game_path')
             if game_path:
                 self.game_path_input.setText(game_path)
             
-            # Launch options
-            self.console_checkbox.setChecked(
-                self.db.get_setting('launch_console', 'false') == 'true'
-            )
-            self.skipintro_checkbox.setChecked(
-                self.db.get_setting('launch_skipintro', 'false') == 'true'
-            )
-            self.windowed_checkbox.setChecked(
-                self.db.get_setting('launch_windowed', 'false') == 'true'
-            )
-            self.steam_launch_checkbox.setChecked(
-                self.db.get_setting('launch_via_steam', 'false') == 'true'
-            )
+            # Launch options, falling back to the old per-option keys
+            flags = self.db.get_setting('launch_flags')
+            if flags is not None:
+                flags = int(flags)
+            else:
+                flags = sum(
+                    flag for flag, _, key in self.LAUNCH_FLAGS
+                    if self.db.get_setting(key, 'false') == 'true'
+                )
+            
+            for flag, attr, _ in self.LAUNCH_FLAGS:
+                getattr(self, attr).setChecked(bool(flags & flag))
             
             # UI settings
             theme = self.db.get_setting('theme', 'Dark')
@@ -371,59 +537,76 @@ class SettingsTab(QWidget, LoggerMixin):
             self.logger.error(f"Failed to load settings: {e}")
     
     def save_settings(self):
-        """Save settings to database"""
+        """Save settings to database, validating the game path first"""
+        game_path = self.game_path_input.text().strip()
+        if not game_path or game_path == self._initial.get('game_path'):
+            self._finish_save(game_path or None)
+            return
+        
+        if self.validate_worker is not None:
+            return
+        
+        # Validate in background; saving resumes in on_game_path_validated
+        self.save_btn.setEnabled(False)
+        self.validate_worker = GamePathWorker(game_path)
+        self.validate_worker.validated.connect(self.on_game_path_validated)
+        self.validate_worker.finished.connect(self._on_validate_worker_finished)
+        self.validate_worker.start()
+    
+    def _on_validate_worker_finished(self):
+        """Release the validation thread once it has stopped running"""
+        self.validate_worker = None
+    
+    def on_game_path_validated(self, game_path: str, is_valid: bool, error: str):
+        """Handle game path validation result"""
+        self.save_btn.setEnabled(True)
+        
+        if not is_valid:
+            QMessageBox.warning(self, "Invalid Game Path", error)
+            return
+        
+        self._finish_save(game_path)
+    
+    def _finish_save(self, game_path: Optional[str]):
+        """Write all settings, including the validated game path if given"""
         try:
+            pending = {}
+            
             # Game path
-            game_path = self.game_path_input.text().strip()
             if game_path:
-                # Validate
-                from utils.validators import validate_game_path
-                is_valid, error = validate_game_path(Path(game_path))
-                if not is_valid:
-                    QMessageBox.warning(self, "Invalid Game Path", error)
-                    return
-                
-                self.db.set_setting('game_path', game_path)
+                pending['game_path'] = game_path
             
             # Launch options
-            self.db.set_setting('launch_console', 
-                'true' if self.console_checkbox.isChecked() else 'false')
-            self.db.set_setting('launch_skipintro',
-                'true' if self.skipintro_checkbox.isChecked() else 'false')
-            self.db.set_setting('launch_windowed',
-                'true' if self.windowed_checkbox.isChecked() else 'false')
-            self.db.set_setting('launch_via_steam',
-                'true' if self.steam_launch_checkbox.isChecked() else 'false')
+            pending['launch_flags'] = str(sum(
+                flag for flag, attr, _ in self.LAUNCH_FLAGS
+                if getattr(self, attr).isChecked()
+            ))
+            
+            # Advanced options
+            for key, attr in self.BOOL_FIELDS:
+                pending[key] = 'true' if getattr(self, attr).isChecked() else 'false'
             
             # UI settings
-            self.db.set_setting('theme', self.theme_combo.currentText())
+            pending['theme'] = self.theme_combo.currentText()
             
             # Download settings
-            self.db.set_setting('max_concurrent_downloads',
-                str(self.concurrent_downloads_spin.value()))
-            self.db.set_setting('cache_duration_hours',
-                str(self.cache_duration_spin.value()))
-            self.db.set_setting('request_timeout',
-                str(self.timeout_spin.value()))
-            self.db.set_setting('max_retries',
-                str(self.retries_spin.value()))
+            pending['max_concurrent_downloads'] = str(self.concurrent_downloads_spin.value())
+            pending['cache_duration_hours'] = str(self.cache_duration_spin.value())
+            pending['request_timeout'] = str(self.timeout_spin.value())
+            pending['max_retries'] = str(self.retries_spin.value())
             
             # Advanced settings
-            self.db.set_setting('auto_backup',
-                'true' if self.auto_backup_checkbox.isChecked() else 'false')
-            self.db.set_setting('max_backups',
-                str(self.max_backups_spin.value()))
-            self.db.set_setting('auto_update',
-                'true' if self.auto_update_checkbox.isChecked() else 'false')
-            self.db.set_setting('auto_resolve_deps',
-                'true' if self.auto_resolve_checkbox.isChecked() else 'false')
-            self.db.set_setting('conflict_detection',
-                'true' if self.conflict_detection_checkbox.isChecked() else 'false')
-            self.db.set_setting('log_level',
-                self.log_level_combo.currentText())
+            pending['max_backups'] = str(self.max_backups_spin.value())
+            pending['log_level'] = self.log_level_combo.currentText()
             
-            # Emit signal
-            self.settings_changed.emit()
+            # Write only values that differ from what is stored
+            changes = {k: v for k, v in pending.items() if self._initial.get(k) != v}
+            if changes:
+                self.db.set_settings_bulk(changes)
+                self._initial.update(changes)
+                
+                # Emit signal (debounced)
+                self._emit_timer.start()
             
             QMessageBox.information(self, "Success", "Settings saved successfully")
             
@@ -437,37 +620,59 @@ class SettingsTab(QWidget, LoggerMixin):
     
     def browse_game_path(self):
         """Browse for game directory"""
-        path = QFileDialog.getExistingDirectory(
-            self,
-            "Select Valheim Installation Directory",
-            str(Path.home())
-        )
+        # One dialog reused for every browse; opened non-blocking
+        if self._browse_dialog is None:
+            self._browse_dialog = QFileDialog(
+                self,
+                "Select Valheim Installation Directory",
+                _HOME
+            )
+            self._browse_dialog.setFileMode(QFileDialog.FileMode.Directory)
+            self._browse_dialog.setOption(QFileDialog.Option.ShowDirsOnly, True)
+            self._browse_dialog.fileSelected.connect(self.game_path_input.setText)
         
-        if path:
-            self.game_path_input.setText(path)
+        self._browse_dialog.open()
     
     def auto_detect_game(self):
         """Auto-detect game installation"""
-        try:
-            game_path = self.game_launcher.find_game_path()
-            
-            if game_path:
-                self.game_path_input.setText(str(game_path))
-                QMessageBox.information(
-                    self,
-                    "Success",
-                    f"Valheim found at:\n{game_path}"
-                )
-            else:
-                QMessageBox.warning(
-                    self,
-                    "Not Found",
-                    "Could not auto-detect Valheim installation.\n\n"
-                    "Please browse manually."
-                )
-        except Exception as e:
-            self.logger.error(f"Auto-detect failed: {e}")
-            QMessageBox.critical(self, "Error", f"Auto-detect failed:\n{str(e)}")
+        if self.detect_worker is not None:
+            return
+        
+        # Search in background; the button stays disabled until it finishes
+        self.detect_btn.setEnabled(False)
+        self.detect_btn.setText("🔍 Searching...")
+        
+        self.detect_worker = DetectGameWorker(self.game_launcher)
+        self.detect_worker.detected.connect(self.on_game_detected)
+        self.detect_worker.finished.connect(self._on_detect_worker_finished)
+        self.detect_worker.start()
+    
+    def _on_detect_worker_finished(self):
+        """Release the auto-detect thread once it has stopped running"""
+        self.detect_worker = None
+    
+    def on_game_detected(self, game_path, error: str):
+        """Handle auto-detect result"""
+        self.detect_btn.setEnabled(True)
+        self.detect_btn.setText("🔍 Auto-detect")
+        
+        if error:
+            self.logger.error(f"Auto-detect failed: {error}")
+            QMessageBox.critical(self, "Error", f"Auto-detect failed:\n{error}")
+        elif game_path:
+            self.game_path_input.setText(str(game_path))
+            QMessageBox.information(
+                self,
+                "Success",
+                f"Valheim found at:\n{game_path}"
+            )
+        else:
+            QMessageBox.warning(
+                self,
+                "Not Found",
+                "Could not auto-detect Valheim installation.\n\n"
+                "Please browse manually."
+            )
     
     def clear_cache(self):
         """Clear application cache"""
@@ -482,24 +687,24 @@ class SettingsTab(QWidget, LoggerMixin):
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         
-        if reply == QMessageBox.StandardButton.Yes:
-            try:
-                # Clear cache directory
-                import shutil
-                if Settings.CACHE_DIR.exists():
-                    shutil.rmtree(Settings.CACHE_DIR)
-                    Settings.CACHE_DIR.mkdir(parents=True)
-                
-                # Clear temp directory
-                if Settings.TEMP_DIR.exists():
-                    shutil.rmtree(Settings.TEMP_DIR)
-                    Settings.TEMP_DIR.mkdir(parents=True)
-                
-                QMessageBox.information(self, "Success", "Cache cleared")
-                
-            except Exception as e:
-                self.logger.error(f"Failed to clear cache: {e}")
-                QMessageBox.critical(self, "Error", f"Failed:\n{str(e)}")
+        if reply == QMessageBox.StandardButton.Yes and self.clear_cache_worker is None:
+            # Clear cache and temp directories in background
+            self.clear_cache_worker = ClearCacheWorker()
+            self.clear_cache_worker.done.connect(self.on_cache_cleared)
+            self.clear_cache_worker.finished.connect(self._on_clear_cache_worker_finished)
+            self.clear_cache_worker.start()
+    
+    def _on_clear_cache_worker_finished(self):
+        """Release the cache clearing thread once it has stopped running"""
+        self.clear_cache_worker = None
+    
+    def on_cache_cleared(self, success: bool, error: str):
+        """Handle cache clearing result"""
+        if success:
+            QMessageBox.information(self, "Success", "Cache cleared")
+        else:
+            self.logger.error(f"Failed to clear cache: {error}")
+            QMessageBox.critical(self, "Error", f"Failed:\n{error}")
     
     def cleanup_logs(self):
         """Cleanup old log files"""
@@ -518,24 +723,28 @@ class SettingsTab(QWidget, LoggerMixin):
                 self.logger.error(f"Failed to cleanup logs: {e}")
                 QMessageBox.critical(self, "Error", f"Failed:\n{str(e)}")
     
+    def _open_sender_dir(self):
+        """Open the directory stored on the clicked button's 'path' property"""
+        path = self.sender().property("path")
+        if path:
+            self.open_directory(Path(path))
+    
+    def _open_sender_url(self):
+        """Open the link stored on the clicked button's 'url' property"""
+        url = self.sender().property("url")
+        if url:
+            self.open_url(url)
+    
     def open_directory(self, path: Path):
         """Open directory in file explorer"""
-        import subprocess
-        import platform
-        
         try:
             path.mkdir(parents=True, exist_ok=True)
             
-            if platform.system() == "Windows":
-                subprocess.run(['explorer', str(path)])
-            elif platform.system() == "Darwin":
-                subprocess.run(['open', str(path)])
-            else:
-                subprocess.run(['xdg-open', str(path)])
+            if not QDesktopServices.openUrl(QUrl.fromLocalFile(str(path))):
+                self.logger.error(f"Failed to open directory: {path}")
         except Exception as e:
             self.logger.error(f"Failed to open directory: {e}")
     
     def open_url(self, url: str):
         """Open URL in browser"""
-        import webbrowser
-        webbrowser.open(url)
+        QDesktopServices.openUrl(QUrl(url))
@@ -2,11 +2,21 @@
 File Operations Utilities with Progress Tracking and Safety
 """
 
+import asyncio
+import errno
+import glob
+import os
 import shutil
+import stat
+import sys
 import zipfile
-from pathlib import Path
-from typing import Callable, Optional, List
+import zlib
+from pathlib import Path, PureWindowsPath
+from typing import Callable, Optional, List, Tuple
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from core.exceptions import (
@@ -16,6 +26,140 @@ from core.exceptions import (
 )
 from utils.logger import LoggerMixin
 
+# ISA-L accelerated DEFLATE when the optional isal package is installed
+try:
+    from isal import isal_zipfile as zipfile_backend
+except ImportError:
+    zipfile_backend = zipfile
+
+
+# Bytes per copy step (and per progress callback)
+_COPY_CHUNK = 1024 * 1024
+
+# Progress callbacks fire at most once per this many bytes or seconds
+_PROGRESS_BYTES = 4 * 1024 * 1024
+_PROGRESS_INTERVAL = 0.1
+
+# errno values meaning an in-kernel copy isn't supported for this pair of files
+_KERNEL_COPY_UNSUPPORTED = {
+    errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP,
+    errno.ENOTSOCK
+}
+
+# sendfile() only accepts a regular file as output on Linux (BSD/macOS
+# require a socket)
+_KERNEL_COPY_METHODS = (
+    ('copy_file_range', 'sendfile') if sys.platform.startswith('linux')
+    else ('copy_file_range',)
+)
+
+
+class _ProgressThrottle:
+    """Coalesces progress reports to one per _PROGRESS_BYTES or _PROGRESS_INTERVAL"""
+    
+    def __init__(self):
+        self.last_bytes = 0
+        self.last_time = time.monotonic()
+    
+    def due(self, done_bytes: int, finished: bool = False) -> bool:
+        """True if a report should be sent now; the final report always is"""
+        now = time.monotonic()
+        if (finished
+                or done_bytes - self.last_bytes >= _PROGRESS_BYTES
+                or now - self.last_time >= _PROGRESS_INTERVAL):
+            self.last_bytes = done_bytes
+            self.last_time = now
+            return True
+        return False
+
+
+def _kernel_copy(infd: int, outfd: int, total: int, progress_callback=None) -> bool:
+    """
+    Copy total bytes between file descriptors without leaving the kernel
+    
+    Tries copy_file_range, then (on Linux) sendfile. Returns False (with
+    nothing written) when neither is available for these files; raises
+    OSError if the copy stops short of total bytes.
+    """
+    for method in _KERNEL_COPY_METHODS:
+        if not hasattr(os, method):
+            continue
+        
+        copied = 0
+        try:
+            while copied < total:
+                count = min(_COPY_CHUNK, total - copied)
+                if method == 'copy_file_range':
+                    sent = os.copy_file_range(infd, outfd, count)
+                else:
+                    sent = os.sendfile(outfd, infd, copied, count)
+                
+                if sent == 0:
+                    if not copied:
+                        # Some filesystems report 0 instead of an error
+                        raise OSError(errno.ENOSYS, "no data copied")
+                    raise OSError(errno.EIO, f"short copy: {copied} of {total} bytes")
+                copied += sent
+                
+                if progress_callback:
+                    progress_callback(copied, total)
+            return True
+            
+        except OSError as e:
+            if copied or e.errno not in _KERNEL_COPY_UNSUPPORTED:
+                raise
+    
+    return False
+
+
+def _scan_files(root: Path, prefix: str):
+    """Yield (arcname, path, stat) for files under root with one scandir pass"""
+    stack = [(os.fspath(root), prefix)]
+    while stack:
+        directory, arc_dir = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                arcname = f"{arc_dir}/{entry.name}"
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, arcname))
+                elif entry.is_file():
+                    yield arcname, entry.path, entry.stat()
+
+
+def _scan_dir(path: str) -> Tuple[int, List[str]]:
+    """
+    Size of the files directly in path and its subdirectory paths
+    
+    Unreadable or vanished directories count as empty, matching the
+    rglob() walk this replaced.
+    """
+    total = 0
+    subdirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+                    elif entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return total, subdirs
+
+
+def _tree_size(path: str) -> int:
+    """Total size of files under path, using DirEntry cached stats"""
+    total = 0
+    stack = [path]
+    while stack:
+        size, subdirs = _scan_dir(stack.pop())
+        total += size
+        stack.extend(subdirs)
+    return total
+
 
 class FileOperations(LoggerMixin):
     """Safe file operations with progress tracking"""
@@ -43,14 +187,23 @@ class FileOperations(LoggerMixin):
             total_size = src.stat().st_size
             copied = 0
             
+            report = None
+            if progress_callback:
+                throttle = _ProgressThrottle()
+                
+                def report(done: int, total: int):
+                    if throttle.due(done, done >= total):
+                        progress_callback(done, total)
+            
             with open(src, 'rb') as fsrc:
                 with open(dst, 'wb') as fdst:
-                    while chunk := fsrc.read(8192):
-                        fdst.write(chunk)
-                        copied += len(chunk)
-                        
-                        if progress_callback:
-                            progress_callback(copied, total_size)
+                    if not _kernel_copy(fsrc.fileno(), fdst.fileno(), total_size, report):
+                        while chunk := fsrc.read(_COPY_CHUNK):
+                            fdst.write(chunk)
+                            copied += len(chunk)
+                            
+                            if report:
+                                report(copied, total_size)
             
             # Preserve metadata
             shutil.copystat(src, dst)
@@ -137,11 +290,16 @@ class FileOperations(LoggerMixin):
     
     @staticmethod
     def get_directory_size(path: Path) -> int:
-        """Get total size of directory in bytes"""
-        total = 0
-        for item in path.rglob('*'):
-            if item.is_file():
-                total += item.stat().st_size
+        """Get total size of directory in bytes (0 if it is not a directory)"""
+        total, subdirs = _scan_dir(path)
+        
+        # Walk top-level subdirectories concurrently
+        if len(subdirs) > 1:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                total += sum(executor.map(_tree_size, subdirs))
+        elif subdirs:
+            total += _tree_size(subdirs[0])
+        
         return total
     
     @staticmethod
@@ -180,16 +338,17 @@ class ArchiveExtractor(LoggerMixin):
         extracted_files = []
         
         try:
-            with zipfile.ZipFile(archive_path, 'r') as zip_ref:
-                # Validate archive
-                if zip_ref.testzip() is not None:
-                    raise ExtractionError(f"Archive is corrupted: {archive_path}")
-                
-                members = zip_ref.namelist()
-                total = len(members)
+            with zipfile_backend.ZipFile(archive_path, 'r') as zip_ref:
+                # No separate testzip() pass: extract() checks each entry's CRC
+                infos = zip_ref.infolist()
+                total = len(infos)
+                throttle = _ProgressThrottle()
+                bytes_done = 0
                 
-                for i, member in enumerate(members):
-                    if progress_callback:
+                for i, info in enumerate(infos):
+                    member = info.filename
+                    bytes_done += info.file_size
+                    if progress_callback and throttle.due(bytes_done, i + 1 == total):
                         progress_callback(i + 1, total, member)
                     
                     # Security: Prevent path traversal
@@ -198,18 +357,97 @@ class ArchiveExtractor(LoggerMixin):
                         raise ExtractionError(f"Invalid archive member: {member}")
                     
                     # Extract
-                    extracted_path = extract_to / member
-                    zip_ref.extract(member, extract_to)
-                    
-                    if extracted_path.exists():
-                        extracted_files.append(extracted_path)
+                    extracted_files.append(Path(zip_ref.extract(member, extract_to)))
             
             return extracted_files
             
-        except zipfile.BadZipFile as e:
-            raise ExtractionError(f"Invalid ZIP file: {e}")
+        except ExtractionError:
+            raise
+        except (zipfile.BadZipFile, zlib.error) as e:
+            raise ExtractionError(f"Archive is corrupted: {archive_path}: {e}")
+        except Exception as e:
+            raise ExtractionError(f"Extraction failed: {e}")
+    
+    @staticmethod
+    async def extract_zip_async(
+        archive_path: Path,
+        extract_to: Path,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        max_workers: Optional[int] = None
+    ) -> List[Path]:
+        """
+        Extract ZIP archive with entries decompressed concurrently
+        
+        Same contract as extract_zip, but entries are extracted on a thread
+        pool, each worker reading through its own ZipFile handle. The
+        progress callback runs on the event loop as entries complete.
+        
+        Returns:
+            List of extracted file paths, in archive order
+        
+        Raises:
+            ExtractionError: If extraction fails
+        """
+        loop = asyncio.get_running_loop()
+        local = threading.local()
+        handles = []
+        
+        def extract_member(member: str) -> Tuple[str, Path]:
+            zip_ref = getattr(local, 'zip_ref', None)
+            if zip_ref is None:
+                zip_ref = local.zip_ref = zipfile_backend.ZipFile(archive_path, 'r')
+                handles.append(zip_ref)
+            return member, Path(zip_ref.extract(member, extract_to))
+        
+        pool = ThreadPoolExecutor(max_workers=max_workers)
+        futures = []
+        
+        try:
+            with zipfile_backend.ZipFile(archive_path, 'r') as zip_ref:
+                members = zip_ref.namelist()
+            
+            # Security: Prevent path traversal. Absolute names and drive
+            # letters are refused outright (checked with Windows rules on
+            # every platform, which also catch backslash separators).
+            parents = set()
+            for member in members:
+                win_path = PureWindowsPath(member)
+                if (
+                    win_path.anchor
+                    or any(part.startswith('..') for part in win_path.parts)
+                ):
+                    raise ExtractionError(f"Invalid archive member: {member}")
+                parents.add(extract_to.joinpath(*win_path.parts).parent)
+            
+            # Create parent directories first so workers don't race on them
+            for parent in parents:
+                if not is_path_inside(parent, extract_to):
+                    raise ExtractionError(f"Invalid archive member path: {parent}")
+                parent.mkdir(parents=True, exist_ok=True)
+            
+            total = len(members)
+            futures = [loop.run_in_executor(pool, extract_member, m) for m in members]
+            
+            for i, future in enumerate(asyncio.as_completed(futures)):
+                member, _ = await future
+                if progress_callback:
+                    progress_callback(i + 1, total, member)
+            
+            return [future.result()[1] for future in futures]
+            
+        except ExtractionError:
+            raise
+        except (zipfile.BadZipFile, zlib.error) as e:
+            raise ExtractionError(f"Archive is corrupted: {archive_path}: {e}")
         except Exception as e:
             raise ExtractionError(f"Extraction failed: {e}")
+        finally:
+            # Let in-flight entries finish before closing their handles
+            if futures:
+                await asyncio.gather(*futures, return_exceptions=True)
+            pool.shutdown(wait=False)
+            for handle in handles:
+                handle.close()
     
     @staticmethod
     def create_zip(
@@ -233,21 +471,26 @@ class ArchiveExtractor(LoggerMixin):
         try:
             archive_path.parent.mkdir(parents=True, exist_ok=True)
             
+            # Collect files with their stats in a single pass
             if source_path.is_file():
-                files = [source_path]
+                files = [(source_path.name, os.fspath(source_path), source_path.stat())]
             else:
-                files = list(source_path.rglob('*'))
-                files = [f for f in files if f.is_file()]
+                files = sorted(_scan_files(source_path, source_path.name))
             
             total = len(files)
             
-            with zipfile.ZipFile(archive_path, 'w', compression) as zip_ref:
-                for i, file_path in enumerate(files):
+            with zipfile_backend.ZipFile(archive_path, 'w', compression) as zip_ref:
+                for i, (arcname, file_path, st) in enumerate(files):
                     if progress_callback:
-                        progress_callback(i + 1, total, file_path.name)
+                        progress_callback(i + 1, total, os.path.basename(file_path))
+                    
+                    zinfo = zipfile.ZipInfo(arcname, date_time=time.localtime(st.st_mtime)[:6])
+                    zinfo.compress_type = compression
+                    zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+                    zinfo.file_size = st.st_size
                     
-                    arcname = file_path.relative_to(source_path.parent)
-                    zip_ref.write(file_path, arcname)
+                    with open(file_path, 'rb') as fsrc, zip_ref.open(zinfo, 'w') as fdst:
+                        shutil.copyfileobj(fsrc, fdst, _COPY_CHUNK)
             
             return archive_path
             
@@ -274,32 +517,56 @@ class TempDirectory:
                 pass  # Best effort cleanup
 
 
+def _clear_readonly(func, path, exc_info):
+    """rmtree error hook: drop the read-only bit and retry once"""
+    if isinstance(exc_info[1], FileNotFoundError):
+        return
+    os.chmod(path, stat.S_IWRITE)
+    func(path)
+
+
+def _tombstone_name(path: Path) -> str:
+    """Hidden sibling name a locked directory is renamed to before deletion"""
+    return f".{path.name}.deleted-{os.getpid()}-{time.monotonic_ns()}"
+
+
 def safe_remove_directory(path: Path, max_retries: int = 3) -> bool:
     """
     Safely remove directory with retries
     
-    Sometimes files are locked by Windows Explorer or other processes.
-    This function retries removal with delays.
+    Read-only files are made writable and removed in place. Files locked
+    by Windows Explorer or other processes are retried with a short
+    exponential backoff; if the last attempt still fails, the directory is
+    renamed to a hidden tombstone so its path is free at once, and the
+    tombstone is deleted as far as possible now and again on later calls.
     """
-    import time
+    # Leftovers of earlier removals of this directory
+    for tombstone in path.parent.glob(f".{glob.escape(path.name)}.deleted-*"):
+        shutil.rmtree(tombstone, ignore_errors=True)
     
     for attempt in range(max_retries):
         try:
             if not path.exists():
                 return True
             
-            shutil.rmtree(path)
+            shutil.rmtree(path, onerror=_clear_readonly)
             return True
             
         except PermissionError:
             if attempt < max_retries - 1:
-                time.sleep(0.5 * (attempt + 1))  # Increasing delay
-            else:
-                return False
+                time.sleep(min(0.05 * 2 ** attempt, 0.4))
         except Exception:
             return False
     
-    return False
+    # Still locked: move it out of the way, then delete what can be deleted
+    tombstone = path.with_name(_tombstone_name(path))
+    try:
+        path.rename(tombstone)
+    except OSError:
+        return False
+    
+    shutil.rmtree(tombstone, ignore_errors=True)
+    return True
 
 
 def copy_with_progress(
@@ -311,13 +578,17 @@ def copy_with_progress(
     return FileOperations.copy_with_progress(src, dst, progress_callback)
 
 
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
 def format_size(bytes_size: int) -> str:
     """Format bytes as human-readable size"""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_size < 1024.0:
-            return f"{bytes_size:.1f} {unit}"
-        bytes_size /= 1024.0
-    return f"{bytes_size:.1f} PB"
+    bytes_size = int(bytes_size)
+    if bytes_size < 1024:
+        return f"{bytes_size} B"
+    # Each unit is 10 bits wide, so the bit length picks it directly
+    index = min((bytes_size.bit_length() - 1) // 10, len(_UNITS) - 1)
+    return f"{bytes_size / (1 << (index * 10)):.1f} {_UNITS[index]}"
 
 
 def find_files_by_extension(
@@ -325,11 +596,22 @@ def find_files_by_extension(
     extensions: List[str]
 ) -> List[Path]:
     """Find all files with given extensions in directory"""
+    exts = tuple(ext if ext.startswith('.') else f'.{ext}' for ext in extensions)
+    
+    # One scandir walk, testing every name against all extensions at once.
+    # Unreadable or missing directories are skipped, as rglob() does.
     files = []
-    for ext in extensions:
-        if not ext.startswith('.'):
-            ext = f'.{ext}'
-        files.extend(directory.rglob(f'*{ext}'))
+    stack = [os.fspath(directory)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(exts):
+                        files.append(Path(entry.path))
+        except OSError:
+            continue
     return files
 
 
@@ -3,20 +3,87 @@ Hash Calculation Utilities using xxHash for Fast Performance
 """
 
 import xxhash
+import hashlib
+import mmap
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Optional
-from collections import OrderedDict
+from typing import Dict, Optional, Union
+from itertools import islice
 
 from config.settings import Settings
 
 
+# Files above this size are hashed through mmap; smaller ones with plain reads
+_MMAP_THRESHOLD = 64 * 1024
+
+# Read size for small files and for the fallback when mmap is unavailable
+_READ_SIZE = 1024 * 1024
+
+
+# Pristine hasher states; copying one is cheaper than constructing anew
+_BASE = {
+    'xxh3_64': xxhash.xxh3_64(),
+    'xxhash64': xxhash.xxh64(),
+}
+
+
+def _new_hasher(algorithm: str):
+    """Create an empty hasher for algorithm"""
+    base = _BASE.get(algorithm)
+    if base is None:
+        base = _BASE.setdefault(algorithm, hashlib.new(algorithm))
+    return base.copy()
+
+
+def _walk_files(root: str):
+    """Yield (relative path, DirEntry) for every file under root via os.scandir"""
+    prefix_len = len(os.path.join(root, ''))
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry.path[prefix_len:], entry
+
+
+def _update_from_file(hasher, file_path: Path, size: Optional[int] = None):
+    """
+    Feed a file's bytes into hasher, mapping large files instead of reading them
+    
+    size is the file's size if the caller has already stat'ed it.
+    """
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        if size is None:
+            size = os.fstat(fd).st_size
+        if size > _MMAP_THRESHOLD:
+            try:
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                        mapped.madvise(mmap.MADV_SEQUENTIAL)
+                    hasher.update(mapped)
+                return
+            except (OSError, ValueError):
+                # Some filesystems (e.g. network shares) refuse mappings
+                os.lseek(fd, 0, os.SEEK_SET)
+        
+        while chunk := os.read(fd, _READ_SIZE):
+            hasher.update(chunk)
+    finally:
+        os.close(fd)
+
+
 def calculate_file_hash(file_path: Path, algorithm: str = Settings.HASH_ALGORITHM) -> str:
     """
     Calculate hash of a file
     
     Args:
         file_path: Path to file
-        algorithm: Hash algorithm ('xxhash64', 'md5', 'sha256')
+        algorithm: Hash algorithm ('xxh3_64', 'xxhash64', 'md5', 'sha256')
     
     Returns:
         Hex digest of file hash
@@ -24,16 +91,17 @@ def calculate_file_hash(file_path: Path, algorithm: str = Settings.HASH_ALGORITH
     if not file_path.exists():
         return ""
     
-    if algorithm == 'xxhash64':
-        hasher = xxhash.xxh64()
-    else:
-        import hashlib
-        hasher = hashlib.new(algorithm)
-    
-    with open(file_path, 'rb') as f:
-        while chunk := f.read(8192):
-            hasher.update(chunk)
-    
+    return _hash_path(file_path, algorithm)
+
+
+def _hash_path(
+    file_path: Union[Path, str],
+    algorithm: str = Settings.HASH_ALGORITHM,
+    size: Optional[int] = None
+) -> str:
+    """Hash a file known to exist (size as in _update_from_file)"""
+    hasher = _new_hasher(algorithm)
+    _update_from_file(hasher, file_path, size)
     return hasher.hexdigest()
 
 
@@ -51,113 +119,126 @@ def calculate_directory_hash(directory: Path, algorithm: str = Settings.HASH_ALG
     if not directory.exists() or not directory.is_dir():
         return ""
     
-    if algorithm == 'xxhash64':
-        hasher = xxhash.xxh64()
-    else:
-        import hashlib
-        hasher = hashlib.new(algorithm)
+    hasher = _new_hasher(algorithm)
     
-    # Sort files for consistent hashing
-    files = sorted(directory.rglob('*'))
+    # Single scandir walk; sort encoded relative paths for consistent hashing
+    files = sorted(
+        (os.fsencode(rel_path), entry.path, entry.stat().st_size)
+        for rel_path, entry in _walk_files(os.fspath(directory))
+    )
     
-    for file_path in files:
-        if file_path.is_file():
-            # Include relative path in hash
-            rel_path = file_path.relative_to(directory)
-            hasher.update(str(rel_path).encode())
-            
-            # Include file content
-            file_hash = calculate_file_hash(file_path, algorithm)
-            hasher.update(file_hash.encode())
+    for rel_path, file_path, size in files:
+        # Include relative path and size, which delimit the content
+        hasher.update(rel_path + b'\0' + size.to_bytes(8, 'little'))
+        
+        # Include file content directly; no per-file hasher
+        _update_from_file(hasher, file_path)
     
     return hasher.hexdigest()
 
 
 def calculate_string_hash(data: str, algorithm: str = Settings.HASH_ALGORITHM) -> str:
     """Calculate hash of string data"""
-    if algorithm == 'xxhash64':
-        return xxhash.xxh64(data.encode()).hexdigest()
-    else:
-        import hashlib
-        return hashlib.new(algorithm, data.encode()).hexdigest()
+    hasher = _new_hasher(algorithm)
+    hasher.update(data.encode())
+    return hasher.hexdigest()
 
 
 class HashCache:
     """
-    LRU Cache for file hashes to avoid recalculation
+    Cache for file hashes to avoid recalculation
+    
+    Entries are keyed on (path, mtime_ns, size), so a lookup for an
+    unchanged file is one stat and one dict hit, and a modified file simply
+    misses. Stale and old entries are dropped in one pass once the cache
+    grows past EVICT_RATIO * max_size. Lookups take no lock; writes do.
     """
     
+    EVICT_RATIO = 1.25
+    
     def __init__(self, max_size: int = 1000):
-        self.cache: OrderedDict[str, tuple] = OrderedDict()
+        self.cache: Dict[tuple, str] = {}
         self.max_size = max_size
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _key(file_path: Union[Path, str]) -> str:
+        """Absolute path string used as the cache key"""
+        return os.path.abspath(os.fspath(file_path))
     
-    def get(self, file_path: Path) -> Optional[str]:
+    def get(self, file_path: Union[Path, str], stat: os.stat_result = None) -> Optional[str]:
         """
         Get cached hash for file
         
+        Args:
+            file_path: Path to file
+            stat: The file's stat result, if the caller already has one
+        
         Returns:
             Hash if cached and file unchanged, None otherwise
         """
-        key = str(file_path.absolute())
+        key = self._key(file_path)
         
-        if key not in self.cache:
-            return None
+        if stat is None:
+            try:
+                stat = os.stat(key)
+            except (OSError, FileNotFoundError):
+                # File no longer exists
+                return None
         
-        # Check if file was modified since caching
-        cached_hash, cached_mtime, cached_size = self.cache[key]
+        return self.cache.get((key, stat.st_mtime_ns, stat.st_size))
+    
+    def put(self, file_path: Union[Path, str], file_hash: str, stat: os.stat_result = None):
+        """Cache file hash with metadata (stat as in get)"""
+        key = self._key(file_path)
         
-        try:
-            stat = file_path.stat()
-            if stat.st_mtime == cached_mtime and stat.st_size == cached_size:
-                # Move to end (mark as recently used)
-                self.cache.move_to_end(key)
-                return cached_hash
-        except (OSError, FileNotFoundError):
-            # File no longer exists
-            del self.cache[key]
-            return None
+        if stat is None:
+            try:
+                stat = os.stat(key)
+            except (OSError, FileNotFoundError):
+                return
         
-        # File was modified, remove from cache
-        del self.cache[key]
-        return None
+        with self._lock:
+            self.cache[(key, stat.st_mtime_ns, stat.st_size)] = file_hash
+            
+            # Drop the oldest entries in one pass once well over the limit
+            if len(self.cache) > self.max_size * self.EVICT_RATIO:
+                excess = len(self.cache) - self.max_size
+                self.cache = dict(islice(self.cache.items(), excess, None))
     
-    def put(self, file_path: Path, file_hash: str):
-        """Cache file hash with metadata"""
-        key = str(file_path.absolute())
+    def calculate_or_get(self, file_path: Union[Path, str]) -> str:
+        """Get cached hash or calculate and cache it"""
+        key = self._key(file_path)
         
+        # One stat serves both the lookup and the store
         try:
-            stat = file_path.stat()
-            self.cache[key] = (file_hash, stat.st_mtime, stat.st_size)
-            
-            # Move to end (mark as recently used)
-            self.cache.move_to_end(key)
-            
-            # Enforce max size
-            if len(self.cache) > self.max_size:
-                self.cache.popitem(last=False)  # Remove oldest
-                
+            stat = os.stat(key)
         except (OSError, FileNotFoundError):
-            pass
-    
-    def calculate_or_get(self, file_path: Path) -> str:
-        """Get cached hash or calculate and cache it"""
-        cached = self.get(file_path)
+            return ""
+        
+        cached = self.get(key, stat)
         if cached:
             return cached
         
-        file_hash = calculate_file_hash(file_path)
-        self.put(file_path, file_hash)
+        try:
+            file_hash = _hash_path(key, size=stat.st_size)
+        except OSError:
+            # Removed or replaced since the stat
+            return ""
+        self.put(key, file_hash, stat)
         return file_hash
     
-    def invalidate(self, file_path: Path):
+    def invalidate(self, file_path: Union[Path, str]):
         """Remove file from cache"""
-        key = str(file_path.absolute())
-        if key in self.cache:
-            del self.cache[key]
+        key = self._key(file_path)
+        with self._lock:
+            for cache_key in [k for k in self.cache if k[0] == key]:
+                del self.cache[cache_key]
     
     def clear(self):
         """Clear all cached hashes"""
-        self.cache.clear()
+        with self._lock:
+            self.cache.clear()
     
     def size(self) -> int:
         """Get number of cached items"""
@@ -178,26 +259,33 @@ class FileHasher:
         progress_callback=None
     ) -> Dict[str, str]:
         """
-        Calculate hashes for multiple files
+        Calculate hashes for multiple files in parallel
         
         Args:
             files: List of file paths
-            progress_callback: Optional callback(current, total, filename)
+            progress_callback: Optional callback(current, total, filename),
+                called from this thread as each file completes
         
         Returns:
-            Dict mapping file path to hash
+            Dict mapping file path to hash, in the order of files
         """
-        result = {}
+        hashes = {}
         total = len(files)
         
-        for i, file_path in enumerate(files):
-            if progress_callback:
-                progress_callback(i + 1, total, file_path.name)
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = {
+                executor.submit(self.cache.calculate_or_get, file_path): file_path
+                for file_path in files
+            }
             
-            file_hash = self.cache.calculate_or_get(file_path)
-            result[str(file_path)] = file_hash
+            for i, future in enumerate(as_completed(futures)):
+                file_path = futures[future]
+                hashes[str(file_path)] = future.result()
+                
+                if progress_callback:
+                    progress_callback(i + 1, total, file_path.name)
         
-        return result
+        return {str(f): hashes[str(f)] for f in files}
     
     def compare_directories(
         self,
@@ -210,18 +298,25 @@ class FileHasher:
         Returns:
             Tuple of (only_in_dir1, only_in_dir2, different_files)
         """
-        files1 = {f.relative_to(dir1): f for f in dir1.rglob('*') if f.is_file()}
-        files2 = {f.relative_to(dir2): f for f in dir2.rglob('*') if f.is_file()}
+        files1 = {Path(rel): entry for rel, entry in _walk_files(os.fspath(dir1))}
+        files2 = {Path(rel): entry for rel, entry in _walk_files(os.fspath(dir2))}
         
-        only_in_dir1 = set(files1.keys()) - set(files2.keys())
-        only_in_dir2 = set(files2.keys()) - set(files1.keys())
+        only_in_dir1 = files1.keys() - files2.keys()
+        only_in_dir2 = files2.keys() - files1.keys()
         
-        common_files = set(files1.keys()) & set(files2.keys())
+        common_files = files1.keys() & files2.keys()
         different_files = set()
         
         for rel_path in common_files:
-            hash1 = self.cache.calculate_or_get(files1[rel_path])
-            hash2 = self.cache.calculate_or_get(files2[rel_path])
+            entry1, entry2 = files1[rel_path], files2[rel_path]
+            
+            # Files of different sizes can't match; skip hashing them
+            if entry1.stat().st_size != entry2.stat().st_size:
+                different_files.add(rel_path)
+                continue
+            
+            hash1 = self.cache.calculate_or_get(entry1.path)
+            hash2 = self.cache.calculate_or_get(entry2.path)
             
             if hash1 != hash2:
                 different_files.add(rel_path)
@@ -229,18 +324,28 @@ class FileHasher:
         return only_in_dir1, only_in_dir2, different_files
 
 
-def verify_file_integrity(file_path: Path, expected_hash: str) -> bool:
+def verify_file_integrity(
+    file_path: Path,
+    expected_hash: str,
+    expected_size: Optional[int] = None
+) -> bool:
     """
     Verify file integrity against expected hash
     
     Args:
         file_path: Path to file
         expected_hash: Expected hash value
+        expected_size: Expected size in bytes; a mismatch fails without hashing
     
     Returns:
         True if hash matches, False otherwise
     """
-    if not file_path.exists():
+    try:
+        size = os.stat(file_path).st_size
+    except (OSError, FileNotFoundError):
+        return False
+    
+    if expected_size is not None and size != expected_size:
         return False
     
     actual_hash = calculate_file_hash(file_path)
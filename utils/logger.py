@@ -3,12 +3,22 @@ Centralized Logging System with Rotation and Multiple Handlers
 """
 
 import logging
+import os
+import sys
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from datetime import datetime
 from config.settings import Settings
 
 
+# ANSI colours only when the console is a terminal that understands them
+# (stderr is None in windowed builds)
+_USE_COLOR = bool(
+    sys.stderr is not None and sys.stderr.isatty()
+    and (os.name != 'nt' or 'ANSICON' in os.environ or 'WT_SESSION' in os.environ)
+)
+
+
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with colors for console output"""
     
@@ -78,7 +88,8 @@ def setup_logger(name: str = None, level: str = None) -> logging.Logger:
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     
-    console_format = ColoredFormatter(
+    formatter_class = ColoredFormatter if _USE_COLOR else logging.Formatter
+    console_format = formatter_class(
         '%(levelname)-8s | %(message)s'
     )
     
@@ -102,7 +113,9 @@ class LoggerMixin:
     def logger(self) -> logging.Logger:
         """Get logger for this class"""
         if not hasattr(self, '_logger'):
-            self._logger = setup_logger(self.__class__.__name__)
+            # Child of the application logger: records propagate to its
+            # single set of handlers instead of opening a log file per class
+            self._logger = setup_logger().getChild(self.__class__.__name__)
         return self._logger
 
 
@@ -142,13 +155,21 @@ def cleanup_old_logs(days: int = 30):
     cutoff = datetime.now().timestamp() - (days * 86400)
     
     removed_count = 0
-    for log_file in Settings.LOGS_DIR.glob("*.log*"):
-        if log_file.stat().st_mtime < cutoff:
+    if not Settings.LOGS_DIR.exists():
+        return
+    
+    # Single scandir pass; entries carry their own stat data
+    with os.scandir(Settings.LOGS_DIR) as entries:
+        for entry in entries:
+            if ".log" not in entry.name or not entry.is_file(follow_symlinks=False):
+                continue
+            
             try:
-                log_file.unlink()
-                removed_count += 1
+                if entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                    os.unlink(entry.path)
+                    removed_count += 1
             except Exception as e:
-                logger.warning(f"Failed to remove old log {log_file}: {e}")
+                logger.warning(f"Failed to remove old log {entry.path}: {e}")
     
     if removed_count > 0:
         logger.info(f"Cleaned up {removed_count} old log files")
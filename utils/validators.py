@@ -2,9 +2,15 @@
 Input Validation Utilities
 """
 
+import os
 import re
+import stat
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import Callable, Iterable, List, Tuple, Optional
 
 from config.settings import Settings
 from core.exceptions import (
@@ -13,6 +19,104 @@ from core.exceptions import (
     InvalidProfileNameError
 )
 
+# Shared result for every successful validation
+_OK: Tuple[bool, Optional[str]] = (True, None)
+
+# Vectorised bulk validators when the optional numpy package is installed
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# JIT-compiled bulk port check when the optional numba package is installed
+try:
+    from numba import njit
+except ImportError:
+    _ports_kernel = None
+else:
+    @njit(cache=True)
+    def _ports_kernel(values, out):
+        for i in range(values.shape[0]):
+            out[i] = 1 <= values[i] <= 65535
+
+# Smaller arrays are not worth the kernel dispatch
+_KERNEL_MIN_SIZE = 64
+
+
+# Fixed patterns, compiled once at import and applied with fullmatch().
+# validate_mod_id and validate_version use hand-written scans; their
+# regexes remain the reference definition of the format, which
+# test_validators.py checks the scans against.
+_MOD_ID_RE = re.compile(r'[a-zA-Z0-9_]+-[a-zA-Z0-9_]+')
+_VERSION_RE = re.compile(r'\d+\.\d+\.\d+')
+_URL_RE = re.compile(
+    r'https?://[A-Za-z0-9_\-.]+\.[a-z]{2,}(/.*)?', re.IGNORECASE | re.ASCII
+)
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', re.ASCII)
+
+
+# Practical length limits (RFC 5321 for addresses, common browser limit for URLs)
+_MAX_EMAIL_LENGTH = 254
+_MAX_URL_LENGTH = 2048
+
+# Concrete class Path() instantiates (PosixPath / WindowsPath)
+_PATH_TYPE = type(Path())
+
+# Recent validate_game_path results, least recently used first:
+# (path as given, abspath) -> (monotonic time, result). The given path is
+# part of the key because it appears in the error messages.
+# Short-lived so repeated UI refreshes skip the disk but real changes show.
+_PATH_CACHE_TTL = 2.0
+_PATH_CACHE_SIZE = 64
+_path_cache = OrderedDict()
+_path_cache_lock = threading.Lock()
+
+# Valheim executables, compared against os.path.normcase'd file names
+_EXE_NAMES = frozenset(('valheim.exe', 'valheim', 'valheim.x86_64'))
+
+# Profile name rules, bound at import; see refresh_settings()
+_MIN_PROFILE_LEN = Settings.MIN_PROFILE_NAME_LENGTH
+_MAX_PROFILE_LEN = Settings.MAX_PROFILE_NAME_LENGTH
+_INVALID_PROFILE_CHARS_SET = frozenset(Settings.INVALID_PROFILE_CHARS)
+
+# Invalid filesystem characters mapped to '_' in one translate() pass.
+# Dense over ASCII: translate() then never takes its slow path of a failed
+# table lookup per distinct character.
+_FILENAME_TRANS = {
+    i: '_' if chr(i) in '<>:"/\\|?*' else chr(i) for i in range(128)
+}
+
+
+@lru_cache(maxsize=256)
+def _get_compiled(pattern: str) -> re.Pattern:
+    """Compile a caller-supplied pattern once per distinct string"""
+    return re.compile(pattern)
+
+
+def refresh_settings():
+    """Re-read the Settings values bound at import (after changing Settings)"""
+    global _MIN_PROFILE_LEN, _MAX_PROFILE_LEN, _INVALID_PROFILE_CHARS_SET
+    _MIN_PROFILE_LEN = Settings.MIN_PROFILE_NAME_LENGTH
+    _MAX_PROFILE_LEN = Settings.MAX_PROFILE_NAME_LENGTH
+    _INVALID_PROFILE_CHARS_SET = frozenset(Settings.INVALID_PROFILE_CHARS)
+
+
+def clear_path_cache():
+    """Forget recent validate_game_path results"""
+    with _path_cache_lock:
+        _path_cache.clear()
+
+
+def clear_validation_cache():
+    """Drop memoised results of the string validators"""
+    for func in (
+        _validate_mod_id_cached,
+        _validate_version_cached,
+        _validate_url_cached,
+        _validate_email_cached,
+    ):
+        func.cache_clear()
+
 
 def validate_mod_id(mod_id: str) -> Tuple[bool, Optional[str]]:
     """
@@ -23,22 +127,56 @@ def validate_mod_id(mod_id: str) -> Tuple[bool, Optional[str]]:
     Returns:
         Tuple of (is_valid, error_message)
     """
+    # Only exact str values are memoised; anything else (None, unhashable
+    # objects) is checked directly so it gets an error result, not TypeError
+    if type(mod_id) is str:
+        return _validate_mod_id_cached(mod_id)
+    return _check_mod_id(mod_id)
+
+
+def _check_mod_id(mod_id: str) -> Tuple[bool, Optional[str]]:
+    """Uncached body of validate_mod_id"""
     if not mod_id:
         return False, "Mod ID cannot be empty"
     
     if not isinstance(mod_id, str):
         return False, "Mod ID must be a string"
     
-    # Check format
-    pattern = r'^[a-zA-Z0-9_]+-[a-zA-Z0-9_]+$'
-    if not re.match(pattern, mod_id):
-        return False, "Mod ID must be in format: Author-ModName"
-    
-    # Check length
+    # Check length first so oversized input is never scanned
     if len(mod_id) > 100:
         return False, "Mod ID is too long (max 100 characters)"
     
-    return True, None
+    # Check format: two non-empty [A-Za-z0-9_] runs joined by one '-'
+    author, sep, name = mod_id.partition('-')
+    if (
+        not sep or not author or not name
+        or not mod_id.isascii()
+        or not author.replace('_', 'a').isalnum()
+        or not name.replace('_', 'a').isalnum()
+    ):
+        return False, "Mod ID must be in format: Author-ModName"
+    
+    return _OK
+
+
+_validate_mod_id_cached = lru_cache(maxsize=4096)(_check_mod_id)
+
+
+def validate_mod_ids(ids: Iterable[str]) -> List[Tuple[bool, Optional[str]]]:
+    """
+    Validate many mod IDs in one call
+    
+    Valid IDs are matched in a tight loop; only failures go through
+    validate_mod_id to get their specific error message.
+    
+    Returns:
+        List of (is_valid, error_message) in input order
+    """
+    match = _MOD_ID_RE.fullmatch
+    return [
+        _OK if type(i) is str and len(i) <= 100 and match(i) else validate_mod_id(i)
+        for i in ids
+    ]
 
 
 def validate_profile_name(name: str) -> Tuple[bool, Optional[str]]:
@@ -55,19 +193,19 @@ def validate_profile_name(name: str) -> Tuple[bool, Optional[str]]:
         return False, "Profile name must be a string"
     
     # Check length
-    if len(name) < Settings.MIN_PROFILE_NAME_LENGTH:
-        return False, f"Profile name too short (min {Settings.MIN_PROFILE_NAME_LENGTH} chars)"
-    
-    if len(name) > Settings.MAX_PROFILE_NAME_LENGTH:
-        return False, f"Profile name too long (max {Settings.MAX_PROFILE_NAME_LENGTH} chars)"
+    length = len(name)
+    if not _MIN_PROFILE_LEN <= length <= _MAX_PROFILE_LEN:
+        if length < _MIN_PROFILE_LEN:
+            return False, f"Profile name too short (min {_MIN_PROFILE_LEN} chars)"
+        return False, f"Profile name too long (max {_MAX_PROFILE_LEN} chars)"
     
     # Check for invalid characters
-    invalid_chars = Settings.INVALID_PROFILE_CHARS
-    for char in invalid_chars:
-        if char in name:
-            return False, f"Profile name contains invalid character: '{char}'"
+    bad = _INVALID_PROFILE_CHARS_SET.intersection(name)
+    if bad:
+        char = next(c for c in name if c in bad)
+        return False, f"Profile name contains invalid character: '{char}'"
     
-    return True, None
+    return _OK
 
 
 def validate_version(version: str) -> Tuple[bool, Optional[str]]:
@@ -79,15 +217,25 @@ def validate_version(version: str) -> Tuple[bool, Optional[str]]:
     Returns:
         Tuple of (is_valid, error_message)
     """
+    if type(version) is str:
+        return _validate_version_cached(version)
+    return _check_version(version)
+
+
+def _check_version(version: str) -> Tuple[bool, Optional[str]]:
+    """Uncached body of validate_version"""
     if not version:
         return False, "Version cannot be empty"
     
-    # Check semantic version format
-    pattern = r'^\d+\.\d+\.\d+$'
-    if not re.match(pattern, version):
+    # Check semantic version format: exactly three runs of digits
+    parts = version.split('.')
+    if len(parts) != 3 or not all(part.isdecimal() for part in parts):
         return False, "Version must be in format: MAJOR.MINOR.PATCH (e.g., 1.2.3)"
     
-    return True, None
+    return _OK
+
+
+_validate_version_cached = lru_cache(maxsize=4096)(_check_version)
 
 
 def validate_game_path(path: Path) -> Tuple[bool, Optional[str]]:
@@ -100,28 +248,56 @@ def validate_game_path(path: Path) -> Tuple[bool, Optional[str]]:
     if not path:
         return False, "Game path cannot be empty"
     
-    if not isinstance(path, Path):
+    if type(path) is not _PATH_TYPE:
         try:
             path = Path(path)
         except Exception:
             return False, "Invalid path format"
     
-    # Check if path exists
-    if not path.exists():
+    try:
+        key = (str(path), os.path.abspath(path))
+    except ValueError:
+        return False, "Invalid path format"
+    
+    now = time.monotonic()
+    with _path_cache_lock:
+        cached = _path_cache.get(key)
+        if cached is not None and now - cached[0] <= _PATH_CACHE_TTL:
+            _path_cache.move_to_end(key)
+            return cached[1]
+    
+    result = _check_game_dir(path)
+    
+    with _path_cache_lock:
+        _path_cache[key] = (now, result)
+        _path_cache.move_to_end(key)
+        while len(_path_cache) > _PATH_CACHE_SIZE:
+            _path_cache.popitem(last=False)
+    
+    return result
+
+
+def _check_game_dir(path: Path) -> Tuple[bool, Optional[str]]:
+    """Filesystem part of validate_game_path"""
+    # One directory listing answers exists / is_dir / has executable,
+    # stopping at the first executable found
+    normcase = os.path.normcase
+    try:
+        with os.scandir(path) as entries:
+            has_exe = any(normcase(entry.name) in _EXE_NAMES for entry in entries)
+    except FileNotFoundError:
         return False, f"Path does not exist: {path}"
-    
-    # Check if directory
-    if not path.is_dir():
+    except NotADirectoryError:
         return False, f"Path is not a directory: {path}"
-    
-    # Check for Valheim executable
-    exe_names = ['valheim.exe', 'valheim', 'valheim.x86_64']
-    has_exe = any((path / exe).exists() for exe in exe_names)
+    except ValueError:
+        return False, "Invalid path format"
+    except OSError:
+        return False, f"Cannot read directory: {path}"
     
     if not has_exe:
         return False, f"Valheim executable not found in: {path}"
     
-    return True, None
+    return _OK
 
 
 def validate_url(url: str) -> Tuple[bool, Optional[str]]:
@@ -131,15 +307,31 @@ def validate_url(url: str) -> Tuple[bool, Optional[str]]:
     Returns:
         Tuple of (is_valid, error_message)
     """
+    if type(url) is str:
+        return _validate_url_cached(url)
+    return _check_url(url)
+
+
+def _check_url(url: str) -> Tuple[bool, Optional[str]]:
+    """Uncached body of validate_url"""
     if not url:
         return False, "URL cannot be empty"
     
+    # Cheap rejects before the regex: scheme and length
+    if (
+        len(url) > _MAX_URL_LENGTH
+        or not url[:8].lower().startswith(('http://', 'https://'))
+    ):
+        return False, "Invalid URL format"
+    
     # Simple URL validation
-    pattern = r'^https?://[\w\-\.]+\.[a-z]{2,}(/.*)?$'
-    if not re.match(pattern, url, re.IGNORECASE):
+    if not _URL_RE.fullmatch(url):
         return False, "Invalid URL format"
     
-    return True, None
+    return _OK
+
+
+_validate_url_cached = lru_cache(maxsize=4096)(_check_url)
 
 
 def validate_email(email: str) -> Tuple[bool, Optional[str]]:
@@ -149,15 +341,33 @@ def validate_email(email: str) -> Tuple[bool, Optional[str]]:
     Returns:
         Tuple of (is_valid, error_message)
     """
+    if type(email) is str:
+        return _validate_email_cached(email)
+    return _check_email(email)
+
+
+def _check_email(email: str) -> Tuple[bool, Optional[str]]:
+    """Uncached body of validate_email"""
     if not email:
         return False, "Email cannot be empty"
     
+    # Cheap rejects before the regex: pasted non-ASCII, spaces, no '@'
+    if (
+        len(email) > _MAX_EMAIL_LENGTH
+        or not email.isascii()
+        or ' ' in email
+        or '@' not in email
+    ):
+        return False, "Invalid email format"
+    
     # Basic email validation
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    if not re.match(pattern, email):
+    if not _EMAIL_RE.fullmatch(email):
         return False, "Invalid email format"
     
-    return True, None
+    return _OK
+
+
+_validate_email_cached = lru_cache(maxsize=4096)(_check_email)
 
 
 def validate_file_path(path: Path, must_exist: bool = True) -> Tuple[bool, Optional[str]]:
@@ -174,19 +384,30 @@ def validate_file_path(path: Path, must_exist: bool = True) -> Tuple[bool, Optio
     if not path:
         return False, "File path cannot be empty"
     
-    if not isinstance(path, Path):
+    if type(path) is not _PATH_TYPE:
         try:
             path = Path(path)
         except Exception:
             return False, "Invalid path format"
     
-    if must_exist and not path.exists():
+    if not must_exist:
+        return _OK
+    
+    # One stat answers both exists and is_file
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
         return False, f"File does not exist: {path}"
+    except ValueError:
+        # Embedded NUL or otherwise unencodable
+        return False, "Invalid path format"
+    except OSError:
+        return False, f"Cannot access file: {path}"
     
-    if must_exist and not path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         return False, f"Path is not a file: {path}"
     
-    return True, None
+    return _OK
 
 
 def sanitize_filename(filename: str) -> str:
@@ -199,19 +420,8 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename
     """
-    # Remove invalid filesystem characters
-    invalid_chars = r'<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
-    
-    # Remove leading/trailing whitespace and dots
-    filename = filename.strip(' .')
-    
-    # Ensure not empty
-    if not filename:
-        filename = 'unnamed'
-    
-    return filename
+    # Replace invalid characters, trim whitespace/dots, never return empty
+    return filename.translate(_FILENAME_TRANS).strip(' .') or 'unnamed'
 
 
 def sanitize_profile_name(name: str) -> str:
@@ -234,13 +444,36 @@ def validate_port(port: int) -> Tuple[bool, Optional[str]]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    if not isinstance(port, int):
+    # Exact type check: also rejects bool, which subclasses int
+    if type(port) is not int:
         return False, "Port must be an integer"
     
-    if port < 1 or port > 65535:
+    if not 1 <= port <= 65535:
         return False, "Port must be between 1 and 65535"
     
-    return True, None
+    return _OK
+
+
+def validate_ports(values):
+    """
+    Validate many port numbers at once
+    
+    Integer numpy arrays are checked in a single compiled loop (or a
+    vectorised comparison without numba); any other iterable falls back
+    to validate_port per item.
+    
+    Returns:
+        Boolean mask: an ndarray for ndarray input, otherwise a list
+    """
+    if np is not None and isinstance(values, np.ndarray) and values.dtype.kind in 'iu':
+        values = values.ravel()
+        if _ports_kernel is not None and values.shape[0] >= _KERNEL_MIN_SIZE:
+            out = np.empty(values.shape[0], dtype=np.bool_)
+            _ports_kernel(values, out)
+            return out
+        return (values >= 1) & (values <= 65535)
+    
+    return [validate_port(value)[0] for value in values]
 
 
 def validate_positive_integer(value: int, min_value: int = 1) -> Tuple[bool, Optional[str]]:
@@ -254,13 +487,13 @@ def validate_positive_integer(value: int, min_value: int = 1) -> Tuple[bool, Opt
     Returns:
         Tuple of (is_valid, error_message)
     """
-    if not isinstance(value, int):
+    if type(value) is not int:
         return False, "Value must be an integer"
     
     if value < min_value:
         return False, f"Value must be at least {min_value}"
     
-    return True, None
+    return _OK
 
 
 def validate_in_range(
@@ -274,16 +507,66 @@ def validate_in_range(
     Returns:
         Tuple of (is_valid, error_message)
     """
-    if not isinstance(value, (int, float)):
+    if not isinstance(value, (int, float)) or isinstance(value, bool):
         return False, "Value must be numeric"
     
+    # NaN compares false against any bound and would slip through
+    if value != value:
+        return False, "Value must be a number"
+    
     if min_value is not None and value < min_value:
         return False, f"Value must be at least {min_value}"
     
     if max_value is not None and value > max_value:
         return False, f"Value must be at most {max_value}"
     
-    return True, None
+    return _OK
+
+
+def validate_in_range_array(
+    values,
+    min_value: Optional[float] = None,
+    max_value: Optional[float] = None
+):
+    """
+    Validate many numeric values against one range
+    
+    Numeric numpy arrays are checked with vectorised comparisons; any
+    other iterable falls back to validate_in_range per item.
+    
+    Returns:
+        Boolean mask: an ndarray for ndarray input, otherwise a list
+    """
+    if np is not None and isinstance(values, np.ndarray):
+        # Bool arrays (kind 'b') are rejected like bool scalars
+        if values.dtype.kind not in 'iuf':
+            return np.zeros(values.shape, dtype=np.bool_)
+        if values.dtype.kind == 'f':
+            mask = ~np.isnan(values)
+        else:
+            mask = np.ones(values.shape, dtype=np.bool_)
+        if min_value is not None:
+            mask &= values >= min_value
+        if max_value is not None:
+            mask &= values <= max_value
+        return mask
+    
+    return [validate_in_range(value, min_value, max_value)[0] for value in values]
+
+
+def validate_positive_integer_array(values, min_value: int = 1):
+    """
+    Validate many integers against a minimum
+    
+    Returns:
+        Boolean mask: an ndarray for ndarray input, otherwise a list
+    """
+    if np is not None and isinstance(values, np.ndarray):
+        if values.dtype.kind not in 'iu':
+            return np.zeros(values.shape, dtype=np.bool_)
+        return values >= min_value
+    
+    return [validate_positive_integer(value, min_value)[0] for value in values]
 
 
 def validate_choice(value: str, choices: list) -> Tuple[bool, Optional[str]]:
@@ -296,7 +579,7 @@ def validate_choice(value: str, choices: list) -> Tuple[bool, Optional[str]]:
     if value not in choices:
         return False, f"Value must be one of: {', '.join(choices)}"
     
-    return True, None
+    return _OK
 
 
 def validate_regex(value: str, pattern: str, message: str = None) -> Tuple[bool, Optional[str]]:
@@ -306,28 +589,41 @@ def validate_regex(value: str, pattern: str, message: str = None) -> Tuple[bool,
     Returns:
         Tuple of (is_valid, error_message)
     """
-    if not re.match(pattern, value):
+    if not _get_compiled(pattern).match(value):
         return False, message or f"Value does not match required pattern"
     
-    return True, None
+    return _OK
 
 
 class Validator:
-    """Validator class for chaining validations"""
+    """
+    Validator class for chaining validations
+    
+    Checks after the first failure are skipped; pass collect_all=True
+    to run every check and gather all errors (e.g. for form feedback).
+    """
     
-    def __init__(self, value):
+    def __init__(self, value, collect_all: bool = False):
         self.value = value
         self.errors = []
+        self._short_circuit = not collect_all
+        # String form is shared by the length and pattern checks
+        self._str = str(value) if value is not None else ''
+        self._len = len(self._str)
     
     def required(self, message: str = "Value is required"):
         """Check value is not empty"""
+        if self._short_circuit and self.errors:
+            return self
         if not self.value:
             self.errors.append(message)
         return self
     
     def min_length(self, length: int, message: str = None):
         """Check minimum length"""
-        if len(str(self.value)) < length:
+        if self._short_circuit and self.errors:
+            return self
+        if self._len < length:
             self.errors.append(
                 message or f"Minimum length is {length}"
             )
@@ -335,7 +631,9 @@ class Validator:
     
     def max_length(self, length: int, message: str = None):
         """Check maximum length"""
-        if len(str(self.value)) > length:
+        if self._short_circuit and self.errors:
+            return self
+        if self._len > length:
             self.errors.append(
                 message or f"Maximum length is {length}"
             )
@@ -343,7 +641,9 @@ class Validator:
     
     def matches(self, pattern: str, message: str = None):
         """Check matches regex pattern"""
-        if not re.match(pattern, str(self.value)):
+        if self._short_circuit and self.errors:
+            return self
+        if not _get_compiled(pattern).match(self._str):
             self.errors.append(
                 message or "Value does not match required pattern"
             )
@@ -362,6 +662,59 @@ class Validator:
         return "; ".join(self.errors)
 
 
+def compile_validator(
+    required: bool = False,
+    min_length: Optional[int] = None,
+    max_length: Optional[int] = None,
+    pattern: Optional[str] = None,
+    collect_all: bool = False
+) -> Callable[[object], List[str]]:
+    """
+    Build a reusable straight-line validator for a fixed schema
+    
+    Equivalent to Validator(value, collect_all).required().min_length(...)
+    .max_length(...).matches(...).get_errors(), but generated once as a
+    plain function with the bounds and pattern baked in, so validating
+    many values needs no Validator object or method dispatch.
+    
+    Example:
+        check_name = compile_validator(required=True, max_length=50)
+        errors = check_name(value)  # [] when valid
+    
+    Returns:
+        Function mapping a value to its list of error messages
+    """
+    namespace = {}
+    lines = ['def validate(value):']
+    if collect_all:
+        lines.append('    errors = []')
+    
+    def check(condition: str, message: str):
+        name = f'_MSG{len(namespace)}'
+        namespace[name] = message
+        lines.append(f'    if {condition}:')
+        lines.append(f'        errors.append({name})' if collect_all else f'        return [{name}]')
+    
+    if required:
+        check('not value', "Value is required")
+    
+    if min_length is not None or max_length is not None or pattern is not None:
+        lines.append("    text = str(value) if value is not None else ''")
+    if min_length is not None:
+        min_length = int(min_length)
+        check(f'len(text) < {min_length}', f"Minimum length is {min_length}")
+    if max_length is not None:
+        max_length = int(max_length)
+        check(f'len(text) > {max_length}', f"Maximum length is {max_length}")
+    if pattern is not None:
+        namespace['_match'] = _get_compiled(pattern).match
+        check('_match(text) is None', "Value does not match required pattern")
+    
+    lines.append('    return errors' if collect_all else '    return []')
+    exec('\n'.join(lines), namespace)
+    return namespace['validate']
+
+
 # Convenience functions that raise exceptions
 def assert_valid_mod_id(mod_id: str):
     """Assert mod ID is valid, raise exception if not"""